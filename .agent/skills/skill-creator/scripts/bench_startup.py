@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for skillctl.
+
+Runs each command in a fresh interpreter with `-X importtime`, reports
+wall time and the heaviest top-level imports, and fails if the best run
+exceeds the budget or a command imports a module it should not need.
+
+Usage:
+    python bench_startup.py
+    python bench_startup.py --budget-ms 80 --runs 10
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+SKILLCTL = SCRIPTS_DIR / "skillctl.py"
+SKILL_DIR = SCRIPTS_DIR.parent
+
+DEFAULT_BUDGET_MS = 150.0
+DEFAULT_RUNS = 5
+
+# Modules no startup path should pull in
+FORBIDDEN = ["yaml", "subprocess", "multiprocessing", "concurrent.futures"]
+
+
+def bench_commands() -> list:
+    """Commands editor hooks run most often."""
+    return [
+        ["--help"],
+        ["validate", str(SKILL_DIR)],
+        ["init", "--help"],
+        ["package", "--help"],
+    ]
+
+
+def parse_importtime(stderr: str) -> dict:
+    """Map top-level imported modules to cumulative import time (us)."""
+
+    imports = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|", 2)
+        # Nested imports are indented under their parent
+        if not name.startswith("  "):
+            imports[name.strip()] = int(cumulative)
+    return imports
+
+
+def all_imported(stderr: str) -> set:
+    """Every module name that appears in the importtime trace."""
+    return {
+        line.rsplit("|", 1)[1].strip()
+        for line in stderr.splitlines()
+        if line.startswith("import time:") and "cumulative" not in line
+    }
+
+
+def run_once(args: list) -> tuple:
+    """Run skillctl once, returning (wall_ms, stderr)."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", str(SKILLCTL), *args],
+        cwd=SCRIPTS_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    return wall_ms, proc.stderr
+
+
+def bench(budget_ms: float, runs: int) -> bool:
+    """Benchmark every command and print a report."""
+
+    ok = True
+    for args in bench_commands():
+        label = "skillctl " + " ".join(args)
+        timings = []
+        stderr = ""
+        for _ in range(runs):
+            wall_ms, stderr = run_once(args)
+            timings.append(wall_ms)
+        best = min(timings)
+
+        status = "✅" if best <= budget_ms else "❌"
+        print(f"{status} {label}: best {best:.1f} ms, median {sorted(timings)[len(timings) // 2]:.1f} ms")
+
+        heaviest = sorted(parse_importtime(stderr).items(), key=lambda item: -item[1])[:5]
+        for name, us in heaviest:
+            print(f"     {us / 1000:6.1f} ms  {name}")
+
+        loaded = all_imported(stderr)
+        unexpected = [name for name in FORBIDDEN if name in loaded]
+        if unexpected:
+            print(f"  • imports {', '.join(unexpected)} at startup")
+            status = "❌"
+
+        if status == "❌":
+            ok = False
+
+    if ok:
+        print(f"\n✅ Cold start within {budget_ms:.0f} ms budget")
+    else:
+        print(f"\n❌ Cold start regressed (budget {budget_ms:.0f} ms)")
+    return ok
+
+
+def main(argv: list = None, prog: str = None):
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description="Measure skillctl cold-start time"
+    )
+
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help=f"Fail if the best run of any command exceeds this (default: {DEFAULT_BUDGET_MS:.0f})"
+    )
+
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=DEFAULT_RUNS,
+        help=f"Runs per command; the best is compared to the budget (default: {DEFAULT_RUNS})"
+    )
+
+    args = parser.parse_args(argv)
+
+    if bench(args.budget_ms, args.runs):
+        sys.exit(0)
+    else:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
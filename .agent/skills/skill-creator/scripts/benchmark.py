@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Benchmark validate_skill() and package_skill() on a synthetic catalog.
+
+Generates N skills with the init_skill.py scaffold, pads their frontmatter
+and adds compressible and incompressible assets, then times validation
+and packaging cold (parse cache and page cache dropped) and warm.
+Results are written as JSON and can be compared against a baseline.
+
+Usage:
+    python benchmark.py --skills 200 --output bench.json
+    python benchmark.py --skills 200 --baseline bench.json --max-regression 10
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import frontmatter
+from init_skill import create_skill
+from package_skill import BuildCache, package_skill
+from quick_validate import check_skill
+
+WORDS = (
+    "skill agent validate package archive reference script asset workflow "
+    "schema deploy render query index token stream cache build release"
+).split()
+
+
+def generate_catalog(root: Path, skills: int, frontmatter_bytes: int, assets: int,
+                     asset_kb: int, incompressible: float, seed: int = 0) -> list:
+    """Create a synthetic skill catalog under root and return skill paths."""
+
+    rng = random.Random(seed)
+    paths = []
+    with redirect_stdout(io.StringIO()):
+        for i in range(skills):
+            name = f"bench-skill-{i:05d}"
+            create_skill(name, str(root))
+            paths.append(root / name)
+
+    for skill_path in paths:
+        skill_md = skill_path / "SKILL.md"
+        text = skill_md.read_text()
+        padding = []
+        size = 0
+        n = 0
+        while size < frontmatter_bytes:
+            line = f"x-field-{n}: " + " ".join(rng.choice(WORDS) for _ in range(8))
+            padding.append(line)
+            size += len(line) + 1
+            n += 1
+        header_end = text.index("\n---", 3)
+        skill_md.write_text(text[:header_end] + "\n" + "\n".join(padding) + text[header_end:])
+
+        for j in range(assets):
+            asset = skill_path / "assets" / f"asset-{j:03d}.bin"
+            if rng.random() < incompressible:
+                asset.write_bytes(rng.randbytes(asset_kb * 1024))
+            else:
+                line = (" ".join(rng.choice(WORDS) for _ in range(12)) + "\n").encode()
+                asset.write_bytes((line * (asset_kb * 1024 // len(line) + 1))[:asset_kb * 1024])
+
+    return paths
+
+
+def catalog_bytes(paths: list) -> int:
+    """Total size of every file in the catalog."""
+    total = 0
+    for skill_path in paths:
+        for dirpath, _, filenames in os.walk(skill_path):
+            total += sum(os.path.getsize(os.path.join(dirpath, name)) for name in filenames)
+    return total
+
+
+def drop_caches(paths: list) -> None:
+    """Forget parsed frontmatter and evict catalog files from the page cache."""
+    frontmatter.clear_cache()
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for skill_path in paths:
+        for dirpath, _, filenames in os.walk(skill_path):
+            for name in filenames:
+                fd = os.open(os.path.join(dirpath, name), os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                finally:
+                    os.close(fd)
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def timed(name: str, func, skills: int, bytes_read: int) -> dict:
+    """Run func once and return its metrics.
+
+    bytes_read is what the phase actually reads from the catalog, so
+    phases served from a cache report no throughput. ru_maxrss cannot
+    be reset, so the RSS figure is the peak of the whole run so far.
+    """
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        func()
+    seconds = time.perf_counter() - start
+    return {
+        "name": name,
+        "seconds": round(seconds, 4),
+        "skills_per_sec": round(skills / seconds, 2) if seconds else None,
+        "bytes_read": bytes_read,
+        "mb_per_sec": round(bytes_read / (1024 * 1024) / seconds, 2) if seconds and bytes_read else None,
+        "cumulative_peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def run_benchmarks(paths: list, out_dir: Path, jobs: int) -> list:
+    """Time each phase cold and warm."""
+
+    total_bytes = catalog_bytes(paths)
+    # Validation only reads SKILL.md, never scripts, references or assets
+    skill_md_bytes = sum((skill_path / "SKILL.md").stat().st_size for skill_path in paths)
+    skills = len(paths)
+
+    def validate_all():
+        for skill_path in paths:
+            check_skill(skill_path)
+
+    def package_all(force: bool):
+        cache = BuildCache(out_dir)
+        for skill_path in paths:
+            if not package_skill(skill_path, out_dir, force=force, cache=cache, workers=jobs):
+                raise RuntimeError(f"packaging failed for {skill_path}")
+        cache.save()
+
+    results = []
+
+    drop_caches(paths)
+    results.append(timed("validate_cold", validate_all, skills, skill_md_bytes))
+    # Frontmatter is served from the parse cache: only stat() calls
+    results.append(timed("validate_warm", validate_all, skills, 0))
+
+    drop_caches(paths)
+    results.append(timed("package_cold", lambda: package_all(True), skills, total_bytes))
+    results.append(timed("package_warm", lambda: package_all(True), skills, total_bytes))
+    # Nothing changed since the last build: every skill is a cache hit
+    results.append(timed("package_cached", lambda: package_all(False), skills, 0))
+
+    return results
+
+
+def compare(results: list, baseline: dict, max_regression: float) -> bool:
+    """Print a comparison against the baseline; False if any phase regressed."""
+
+    previous = {phase["name"]: phase for phase in baseline.get("results", [])}
+    ok = True
+    for phase in results:
+        old = previous.get(phase["name"])
+        if not old or not old["seconds"]:
+            continue
+        change = (phase["seconds"] - old["seconds"]) / old["seconds"] * 100
+        regressed = change > max_regression
+        ok = ok and not regressed
+        status = "❌" if regressed else "✅"
+        print(f"{status} {phase['name']}: {old['seconds']:.3f}s → {phase['seconds']:.3f}s ({change:+.1f}%)")
+    return ok
+
+
+def main(argv: list = None, prog: str = None):
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description="Benchmark skill validation and packaging on a synthetic catalog"
+    )
+
+    parser.add_argument("--skills", type=int, default=100, help="Number of skills (default: 100)")
+    parser.add_argument("--frontmatter-bytes", type=int, default=256,
+                        help="Extra frontmatter per SKILL.md in bytes (default: 256)")
+    parser.add_argument("--assets", type=int, default=4, help="Assets per skill (default: 4)")
+    parser.add_argument("--asset-kb", type=int, default=64, help="Size of each asset in KiB (default: 64)")
+    parser.add_argument("--incompressible", type=float, default=0.5,
+                        help="Fraction of assets that are random bytes (default: 0.5)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Compression threads per skill (default: 1)")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--baseline", help="Compare against a previous JSON result")
+    parser.add_argument("--max-regression", type=float, default=10.0,
+                        help="Fail if any phase is more than this %% slower than the baseline (default: 10)")
+    parser.add_argument("--keep", help="Generate the catalog here and keep it (default: temp dir)")
+
+    args = parser.parse_args(argv)
+
+    work_dir = Path(args.keep) if args.keep else Path(tempfile.mkdtemp(prefix="skill-bench-"))
+    try:
+        catalog = work_dir / "catalog"
+        catalog.mkdir(parents=True, exist_ok=True)
+        print(f"🏗️  Generating {args.skills} skills in {catalog}")
+        paths = generate_catalog(catalog, args.skills, args.frontmatter_bytes, args.assets,
+                                 args.asset_kb, args.incompressible, args.seed)
+
+        results = run_benchmarks(paths, work_dir / "dist", args.jobs)
+    finally:
+        if not args.keep:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    for phase in results:
+        mb_per_sec = phase["mb_per_sec"] if phase["mb_per_sec"] is not None else "-"
+        print(f"⏱️  {phase['name']:<15} {phase['seconds']:8.3f}s  "
+              f"{phase['skills_per_sec']:>9} skills/s  {mb_per_sec:>8} MB/s  "
+              f"peak RSS so far {phase['cumulative_peak_rss_mb']} MB")
+
+    report = {
+        "params": {key: value for key, value in vars(args).items()
+                   if key not in ("output", "baseline", "keep", "max_regression")},
+        "python": sys.version.split()[0],
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"📄 Results written to {args.output}")
+
+    ok = True
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("params") != report["params"]:
+            print("⚠️  Baseline was recorded with different parameters")
+        ok = compare(results, baseline, args.max_regression)
+        print(f"\n{'✅ No regression' if ok else '❌ Performance regression'} "
+              f"(threshold {args.max_regression:.0f}%)")
+
+    if ok:
+        sys.exit(0)
+    else:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
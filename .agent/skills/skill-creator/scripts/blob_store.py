@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Content-addressed store of compressed file data shared across packages.
+
+Blobs are keyed by the file's sha256 and the deflate level, and hold
+exactly the bytes skill_archive.compress_file() produced, so copying a
+blob into an archive gives the same output as compressing the file again.
+Least recently used blobs are evicted once the store exceeds its cap.
+
+Usage:
+    store = BlobStore(Path("~/.cache/skill-blobs").expanduser())
+    package_skill(skill_path, output_dir, store=store)
+    store.evict()
+"""
+
+import os
+import struct
+import tempfile
+from pathlib import Path
+
+DEFAULT_MAX_MB = 1024
+
+# Bump when the encoding policy in skill_archive changes
+STORE_VERSION = 1
+
+# magic, method, crc, uncompressed size, payload size
+BLOB_HEADER = struct.Struct("<4sBIQQ")
+BLOB_MAGIC = b"SKB1"
+
+
+class BlobStore:
+    """Compressed blobs on disk, with hit counters and an LRU size cap."""
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        self.root = Path(root) / f"v{STORE_VERSION}"
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes_reused = 0
+        self.bytes_total = 0
+        self.evicted = 0
+
+    def _path(self, digest: str, level: int) -> Path:
+        return self.root / digest[:2] / f"{digest}-{level}.blob"
+
+    def get(self, digest: str, level: int) -> tuple:
+        """Return (method, crc, usize, payload) or None if not stored."""
+        path = self._path(digest, level)
+        try:
+            with open(path, "rb") as f:
+                header = f.read(BLOB_HEADER.size)
+                payload = f.read()
+        except OSError:
+            return None
+
+        if len(header) != BLOB_HEADER.size:
+            path.unlink(missing_ok=True)
+            return None
+        magic, method, crc, usize, size = BLOB_HEADER.unpack(header)
+        if magic != BLOB_MAGIC or size != len(payload):
+            # Truncated or foreign file: drop it and recompress
+            path.unlink(missing_ok=True)
+            return None
+
+        try:
+            # Mark as recently used for LRU eviction
+            os.utime(path)
+        except OSError:
+            pass
+        return method, crc, usize, payload
+
+    def put(self, digest: str, level: int, method: int, crc: int, usize: int,
+            payload: bytes) -> None:
+        """Store a blob atomically (concurrent writers produce identical files)."""
+        path = self._path(digest, level)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique per call: threads of one process may store the same digest
+        fd, tmp_path = tempfile.mkstemp(prefix=f"{path.name}.", suffix=".tmp", dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(BLOB_HEADER.pack(BLOB_MAGIC, method, crc, usize, len(payload)))
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def record(self, hit: bool, usize: int) -> None:
+        """Count one lookup for the dedupe report."""
+        self.bytes_total += usize
+        if hit:
+            self.hits += 1
+            self.bytes_reused += usize
+        else:
+            self.misses += 1
+
+    def merge(self, stats: tuple) -> None:
+        """Add counters reported by a worker process (see stats())."""
+        hits, misses, bytes_reused, bytes_total = stats
+        self.hits += hits
+        self.misses += misses
+        self.bytes_reused += bytes_reused
+        self.bytes_total += bytes_total
+
+    def stats(self) -> tuple:
+        return self.hits, self.misses, self.bytes_reused, self.bytes_total
+
+    def size(self) -> int:
+        """Total bytes of blobs on disk."""
+        return sum(size for _, size, _ in self._scan())
+
+    def _scan(self) -> list:
+        blobs = []
+        if not self.root.is_dir():
+            return blobs
+        with os.scandir(self.root) as shards:
+            for shard in shards:
+                if not shard.is_dir():
+                    continue
+                with os.scandir(shard.path) as it:
+                    for entry in it:
+                        if entry.name.endswith(".blob"):
+                            st = entry.stat()
+                            blobs.append((st.st_mtime_ns, st.st_size, entry.path))
+        return blobs
+
+    def evict(self) -> int:
+        """Delete least recently used blobs until under the cap; returns bytes kept."""
+        blobs = self._scan()
+        total = sum(size for _, size, _ in blobs)
+        for _, size, path in sorted(blobs):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            self.evicted += 1
+        return total
+
+    def report(self) -> str:
+        """One-line dedupe summary."""
+        lookups = self.hits + self.misses
+        ratio = self.bytes_reused / self.bytes_total if self.bytes_total else 0.0
+        return (f"🗃️  Blob store: {self.hits}/{lookups} file(s) reused, "
+                f"{ratio:.0%} of compressible bytes deduplicated")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Read the YAML frontmatter of a SKILL.md file.
+
+Only the header is read: the file is streamed line by line up to the
+closing ---. Simple `key: value` headers are parsed without YAML; anything
+else falls back to yaml.safe_load. Results are cached per file, keyed on
+mtime and size, so each SKILL.md is parsed once per run.
+
+Usage:
+    from frontmatter import FrontmatterError, read_frontmatter
+    meta = read_frontmatter(Path("./my-skill/SKILL.md"))
+"""
+
+import os
+import re
+from pathlib import Path
+
+DELIMITER = "---"
+
+# `key: value` where the value is a plain scalar YAML would read as a string
+SIMPLE_LINE = re.compile(r"^([A-Za-z_][A-Za-z0-9_-]*): +([^-?:,\[\]{}#&*!|>'\"%@`=\s+.0-9~][^\t]*?) *$")
+
+# Plain scalars YAML 1.1 resolves to something other than a string
+NON_STRING_SCALARS = {
+    "yes", "no", "true", "false", "on", "off", "null",
+}
+
+_cache = {}
+
+
+class FrontmatterError(ValueError):
+    """Raised when SKILL.md has missing or malformed frontmatter."""
+
+
+def _parse_simple(lines: list) -> dict:
+    """Parse flat `key: value` lines, or return None if YAML is needed."""
+
+    result = {}
+    for line in lines:
+        if not line.strip():
+            continue
+        match = SIMPLE_LINE.match(line)
+        if not match:
+            return None
+        key, value = match.groups()
+        if (
+            key.lower() in NON_STRING_SCALARS
+            or value.lower() in NON_STRING_SCALARS
+            or ": " in value
+            or " #" in value
+            or value.endswith(":")
+        ):
+            return None
+        result[key] = value
+
+    return result
+
+
+def parse_frontmatter_lines(lines) -> dict:
+    """Parse frontmatter from an iterable of text lines.
+
+    Stops consuming lines at the closing delimiter, so the body of the
+    document is never read.
+    """
+
+    lines = iter(lines)
+    first = next(lines, "")
+    if not first.startswith(DELIMITER):
+        raise FrontmatterError("SKILL.md must start with YAML frontmatter (---)")
+
+    header = []
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if line == DELIMITER:
+            break
+        header.append(line)
+    else:
+        raise FrontmatterError("Invalid YAML frontmatter (missing closing ---)")
+
+    data = _parse_simple(header)
+    if data is not None:
+        return data
+
+    import yaml
+
+    try:
+        data = yaml.safe_load("\n".join(header))
+    except yaml.YAMLError as e:
+        raise FrontmatterError(f"Invalid YAML: {e}")
+
+    if data is None:
+        return {}
+    if not isinstance(data, dict):
+        raise FrontmatterError("Invalid YAML frontmatter (expected key: value pairs)")
+    return data
+
+
+def read_frontmatter(skill_md: Path) -> dict:
+    """Return the parsed frontmatter of a SKILL.md file.
+
+    Raises FrontmatterError for malformed frontmatter and OSError if the
+    file cannot be read. Both results are cached until the file changes.
+    """
+
+    key = os.path.abspath(skill_md)
+    st = os.stat(key)
+    cached = _cache.get(key)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        result = cached[2]
+    else:
+        try:
+            with open(key, encoding="utf-8") as f:
+                result = parse_frontmatter_lines(f)
+        except FrontmatterError as e:
+            result = e
+        _cache[key] = (st.st_mtime_ns, st.st_size, result)
+
+    if isinstance(result, FrontmatterError):
+        raise result
+    return dict(result)
+
+
+def clear_cache() -> None:
+    """Forget every cached parse."""
+    _cache.clear()
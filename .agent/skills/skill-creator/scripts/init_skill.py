@@ -4,37 +4,32 @@ Initialize a new skill with SaaS Factory standards.
 
 Usage:
     python init_skill.py my-skill --path ./output
+    python init_skill.py --manifest skills.yaml --path ./output --atomic
 """
 
 import argparse
+import json
 import os
+import re
+import shutil
 from pathlib import Path
 
+DEFAULT_DESCRIPTION = "Describe what this skill does and when Claude should use it."
+DEFAULT_WORKERS = 8
 
-def create_skill(name: str, path: str = ".") -> None:
-    """Create a new skill directory structure."""
-
-    skill_path = Path(path) / name
-
-    # Check if skill already exists
-    if skill_path.exists():
-        print(f"❌ Skill '{name}' already exists at {skill_path}")
-        exit(1)
+MANIFEST_FIELDS = ("name", "description", "path")
 
-    # Create directories
-    skill_path.mkdir(parents=True, exist_ok=True)
-    (skill_path / "scripts").mkdir(exist_ok=True)
-    (skill_path / "references").mkdir(exist_ok=True)
-    (skill_path / "assets").mkdir(exist_ok=True)
+# Descriptions matching this are written as plain YAML scalars, others are quoted
+PLAIN_SCALAR = re.compile(r"[A-Za-z][A-Za-z0-9 ,.;()/+_-]*[A-Za-z0-9.)]")
+YAML_KEYWORDS = {"yes", "no", "true", "false", "on", "off", "null"}
 
-    # Create SKILL.md template
-    skill_md = f"""---
+SKILL_MD_TEMPLATE = """---
 name: {name}
-description: Describe what this skill does and when Claude should use it.
+description: {description}
 license: MIT
 ---
 
-# {name.replace('-', ' ').title()}
+# {title}
 
 ## Purpose
 
@@ -64,11 +59,9 @@ Instructions for the second step.
 - See `assets/` for output resources
 """
 
-    (skill_path / "SKILL.md").write_text(skill_md)
-
-    # Create example files
-    (skill_path / "scripts/example.py").write_text(
-        '''#!/usr/bin/env python3
+# Files that are identical for every skill
+STATIC_FILES = {
+    "scripts/example.py": '''#!/usr/bin/env python3
 """Example script for your skill."""
 
 def example_function():
@@ -77,11 +70,8 @@ def example_function():
 
 if __name__ == "__main__":
     print(example_function())
-'''
-    )
-
-    (skill_path / "references/guide.md").write_text(
-        """# Reference Guide
+''',
+    "references/guide.md": """# Reference Guide
 
 Add detailed documentation here.
 
@@ -93,21 +83,89 @@ Add detailed documentation here.
 
 ## Best Practices
 - Add guidelines and standards
-"""
-    )
-
-    (skill_path / "assets/.gitkeep").write_text("")
-
-    # Create .gitignore
-    (skill_path / ".gitignore").write_text(
-        """*.pyc
+""",
+    "assets/.gitkeep": "",
+    ".gitignore": """*.pyc
 __pycache__/
 *.log
 .DS_Store
 node_modules/
 dist/
-"""
-    )
+""",
+}
+
+
+def valid_name(name: str) -> bool:
+    """Skill names are lowercase letters, digits and hyphens."""
+    return bool(name) and all(c.islower() or c == '-' or c.isdigit() for c in name)
+
+
+def yaml_scalar(value: str) -> str:
+    """Quote a frontmatter value unless it is a safe plain scalar."""
+    if PLAIN_SCALAR.fullmatch(value) and value.lower() not in YAML_KEYWORDS:
+        return value
+    # A JSON string is a valid YAML double-quoted scalar
+    return json.dumps(value)
+
+
+def render_skill(name: str, description: str = None) -> dict:
+    """Return {relative path: content} for a new skill."""
+    files = {
+        "SKILL.md": SKILL_MD_TEMPLATE.format(
+            name=name,
+            description=yaml_scalar(description or DEFAULT_DESCRIPTION),
+            title=name.replace('-', ' ').title(),
+        ),
+    }
+    files.update(STATIC_FILES)
+    return files
+
+
+def write_files(directory: Path, files: dict) -> None:
+    """Write rendered files below directory, creating subdirectories."""
+    for rel, content in files.items():
+        target = directory / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content)
+
+
+def write_skill(skill_path: Path, files: dict, atomic: bool = False) -> None:
+    """Create skill_path with files; raises FileExistsError if it exists.
+
+    With atomic=True the skill is written to a temp dir next to the target
+    and renamed into place, so an interrupted run leaves no partial skill.
+    """
+
+    skill_path.parent.mkdir(parents=True, exist_ok=True)
+    if not atomic:
+        skill_path.mkdir()
+        write_files(skill_path, files)
+        return
+
+    tmp = skill_path.parent / f".{skill_path.name}.{os.getpid()}.tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir()
+    try:
+        write_files(tmp, files)
+        if skill_path.exists():
+            raise FileExistsError(f"{skill_path} already exists")
+        os.rename(tmp, skill_path)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+
+def create_skill(name: str, path: str = ".", description: str = None) -> None:
+    """Create a new skill directory structure."""
+
+    skill_path = Path(path) / name
+
+    # Check if skill already exists
+    if skill_path.exists():
+        print(f"❌ Skill '{name}' already exists at {skill_path}")
+        exit(1)
+
+    write_skill(skill_path, render_skill(name, description))
 
     print(f"✅ Skill '{name}' created at {skill_path}")
     print(f"\n📝 Next steps:")
@@ -118,37 +176,174 @@ dist/
     print(f"  5. Run: python package_skill.py {skill_path}")
 
 
-def main():
+def load_manifest(manifest: Path) -> list:
+    """Read manifest entries (name, description, path) from YAML, JSON or CSV."""
+
+    suffix = manifest.suffix.lower()
+    with open(manifest, newline="", encoding="utf-8") as f:
+        if suffix == ".csv":
+            import csv
+
+            entries = list(csv.DictReader(f))
+        elif suffix == ".json":
+            entries = json.load(f)
+        elif suffix in (".yaml", ".yml"):
+            import yaml
+
+            try:
+                entries = yaml.safe_load(f)
+            except yaml.YAMLError as e:
+                raise ValueError(f"Invalid YAML: {e}")
+        else:
+            raise ValueError(f"Unsupported manifest type '{manifest.suffix}' (use .yaml, .json or .csv)")
+
+    # Allow either a bare list or {"skills": [...]}
+    if isinstance(entries, dict):
+        entries = entries.get("skills")
+    if not isinstance(entries, list) or not all(isinstance(entry, dict) for entry in entries):
+        raise ValueError("Manifest must be a list of entries with name, description and path")
+
+    return [{field: str(entry.get(field) or "").strip() for field in MANIFEST_FIELDS} for entry in entries]
+
+
+def plan_manifest(entries: list, base: Path) -> tuple:
+    """Check every entry up front.
+
+    Returns (jobs, results): results has one slot per entry, filled in
+    for entries that fail or are skipped, and jobs holds the rest.
+    """
+
+    jobs = []
+    results = [None] * len(entries)
+    seen = set()
+    for index, entry in enumerate(entries):
+        name = entry["name"]
+        skill_path = base / (entry["path"] or ".") / name
+        key = skill_path.resolve()
+        if not valid_name(name):
+            results[index] = (name, skill_path, "failed", "name must be lowercase with hyphens only")
+        elif key in seen:
+            results[index] = (name, skill_path, "failed", "duplicate entry in manifest")
+        elif skill_path.exists():
+            seen.add(key)
+            results[index] = (name, skill_path, "skipped", "already exists")
+        else:
+            seen.add(key)
+            jobs.append((index, name, skill_path, entry["description"]))
+    return jobs, results
+
+
+def create_from_manifest(entries: list, base: Path, workers: int = DEFAULT_WORKERS,
+                         atomic: bool = False) -> list:
+    """Create every skill in the manifest; returns (name, path, status, detail) per entry."""
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    jobs, results = plan_manifest(entries, base)
+
+    def run(job):
+        index, name, skill_path, description = job
+        try:
+            write_skill(skill_path, render_skill(name, description), atomic)
+        except FileExistsError:
+            results[index] = (name, skill_path, "skipped", "already exists")
+        except OSError as e:
+            results[index] = (name, skill_path, "failed", str(e))
+        else:
+            results[index] = (name, skill_path, "created", "")
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        list(pool.map(run, jobs))
+
+    return results
+
+
+def report_manifest(results: list) -> bool:
+    """Print one line per entry and a summary; True if nothing failed."""
+
+    icons = {"created": "✅", "skipped": "⏭️ ", "failed": "❌"}
+    counts = {"created": 0, "skipped": 0, "failed": 0}
+    for name, skill_path, status, detail in results:
+        counts[status] += 1
+        suffix = f" ({detail})" if detail else ""
+        print(f"{icons[status]} {name or '(no name)'}: {status} at {skill_path}{suffix}")
+
+    print(f"\n📊 {len(results)} entries: {counts['created']} created, "
+          f"{counts['skipped']} skipped, {counts['failed']} failed")
+    return counts["failed"] == 0
+
+
+def main(argv: list = None, prog: str = None):
     """Main entry point."""
     parser = argparse.ArgumentParser(
+        prog=prog,
         description="Initialize a new skill for SaaS Factory",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
   python init_skill.py my-skill
   python init_skill.py my-skill --path ./skills
+  python init_skill.py --manifest skills.csv --path ./skills --atomic
         """
     )
 
     parser.add_argument(
         "name",
+        nargs="?",
         help="Skill name (lowercase, hyphens only)"
     )
 
+    parser.add_argument(
+        "--description",
+        help="Description for the SKILL.md frontmatter"
+    )
+
     parser.add_argument(
         "--path",
         default=".",
         help="Output directory (default: current directory)"
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--manifest",
+        help="Create every skill listed in a YAML, JSON or CSV file (name, description, path)"
+    )
+
+    parser.add_argument(
+        "--workers", "-j",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Threads writing skills in manifest mode (default: {DEFAULT_WORKERS})"
+    )
+
+    parser.add_argument(
+        "--atomic",
+        action="store_true",
+        help="Write each skill to a temp dir and rename it into place"
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.manifest:
+        if args.name:
+            parser.error("give either a skill name or --manifest, not both")
+        try:
+            entries = load_manifest(Path(args.manifest))
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not read manifest: {e}")
+            exit(1)
+        results = create_from_manifest(entries, Path(args.path), args.workers, args.atomic)
+        exit(0 if report_manifest(results) else 1)
+
+    if not args.name:
+        parser.error("a skill name or --manifest is required")
 
     # Validate name
-    if not all(c.islower() or c == '-' or c.isdigit() for c in args.name):
+    if not valid_name(args.name):
         print(f"❌ Skill name must be lowercase with hyphens only")
         exit(1)
 
-    create_skill(args.name, args.path)
+    create_skill(args.name, args.path, args.description)
 
 
 if __name__ == "__main__":
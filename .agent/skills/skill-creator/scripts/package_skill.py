@@ -5,15 +5,26 @@ Package a skill into a distributable .zip file.
 Usage:
     python package_skill.py ./my-skill
     python package_skill.py ./my-skill ./dist
+    python package_skill.py ./my-skill ./dist --force
+    python package_skill.py ./skills ./dist --all --jobs 8
+    python package_skill.py ./my-skill --list
+    python package_skill.py ./my-skill ./dist --delta-from ./old/my-skill.zip
+    python package_skill.py ./skills ./dist --all --store ~/.cache/skill-blobs
 """
 
 import argparse
-import shutil
-import subprocess
+import json
+import os
 import sys
-import yaml
 from pathlib import Path
 
+from blob_store import DEFAULT_MAX_MB, BlobStore
+from frontmatter import FrontmatterError, read_frontmatter
+from skill_archive import DEFAULT_LEVEL, hash_file, write_skill_archive
+from skill_delta import manifest_path, write_manifest
+from skill_ignore import walk_skill
+from timings import Timings, format_bytes, profiled
+
 
 def validate_before_package(skill_path: Path) -> bool:
     """Validate skill before packaging."""
@@ -24,21 +35,7 @@ def validate_before_package(skill_path: Path) -> bool:
         return False
 
     try:
-        with open(skill_md) as f:
-            content = f.read()
-
-        if not content.startswith("---"):
-            print("❌ Invalid SKILL.md format")
-            return False
-
-        lines = content.split("\n")
-        end_idx = next((i for i in range(1, len(lines)) if lines[i] == "---"), None)
-
-        if not end_idx:
-            print("❌ Invalid YAML frontmatter")
-            return False
-
-        frontmatter = yaml.safe_load("\n".join(lines[1:end_idx]))
+        frontmatter = read_frontmatter(skill_md)
 
         if not frontmatter.get("name"):
             print("❌ Missing required field: name")
@@ -50,69 +47,385 @@ def validate_before_package(skill_path: Path) -> bool:
 
         return True
 
+    except FrontmatterError as e:
+        print(f"❌ {e}")
+        return False
+
     except Exception as e:
         print(f"❌ Validation error: {e}")
         return False
 
 
-def package_skill(skill_path: Path, output_dir: Path) -> bool:
-    """Package skill into a .zip file."""
+CACHE_FILE = ".skill-build-cache.json"
+CACHE_VERSION = 3
+
+
+class BuildCache:
+    """Persistent record of what each packaged skill was built from."""
+
+    def __init__(self, output_dir: Path, load: bool = True):
+        self.path = output_dir / CACHE_FILE
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+
+        if not load:
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION:
+                self.entries = data.get("skills", {})
+        except (OSError, ValueError):
+            # Missing or corrupt cache just means a full rebuild
+            pass
+
+    def lookup(self, skill_path: Path) -> dict:
+        """Return the cached entry for a skill (empty if never built)."""
+        return self.entries.get(str(skill_path), {})
+
+    def store(self, skill_path: Path, zip_file: Path, files: dict, level: int) -> None:
+        """Record the fingerprint a freshly built archive came from."""
+        st = zip_file.stat()
+        self.entries[str(skill_path)] = {
+            "zip": str(zip_file),
+            "zip_size": st.st_size,
+            "zip_mtime_ns": st.st_mtime_ns,
+            "level": level,
+            "files": files,
+        }
+
+    def save(self) -> None:
+        """Write the cache atomically next to the produced archives."""
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"version": CACHE_VERSION, "skills": self.entries}, f)
+        os.replace(tmp_path, self.path)
+
+
+def fingerprint_skill(skill_path: Path, previous: dict, entries: list = None) -> dict:
+    """Map each file to [size, mtime_ns, sha256, executable].
+
+    Hashes are reused from the previous fingerprint when size and mtime
+    match, so an unchanged skill costs one stat() per file and no reads.
+    The exec bit always comes from the current stat(): chmod leaves the
+    mtime alone but changes the archived mode.
+    Only files that would be packaged (see skill_ignore.py) are included;
+    pass the walk_skill() entries if the caller already has them.
+    """
+
+    files = {}
+    for entry in entries if entries is not None else walk_skill(skill_path):
+        if entry.is_dir:
+            continue
+        old = previous.get(entry.arcname)
+        if old and old[0] == entry.size and old[1] == entry.mtime_ns:
+            digest = old[2]
+        else:
+            digest = hash_file(entry.path)
+        files[entry.arcname] = [entry.size, entry.mtime_ns, digest, entry.executable]
+
+    return files
+
+
+def output_paths(skill_path: Path, output_dir: Path, skill_name: str) -> set:
+    """Packager output that must not end up inside the package.
+
+    Packaging it would nest each build's zip in the next one. This
+    skill's archive, manifest, delta, build cache and their temp files
+    are left out at the skill root (where building with the default
+    output dir "." puts them), and an output_dir below the skill is
+    pruned whole.
+    """
+
+    zip_file = skill_path / f"{skill_name}.zip"
+    delta_zip = zip_file.with_suffix(".delta.zip")
+    paths = set()
+    for path in (zip_file, manifest_path(zip_file), delta_zip):
+        paths.update((str(path), f"{path}.tmp"))
+    paths.add(f"{delta_zip}.check.tmp")
+    paths.add(str(skill_path / CACHE_FILE))
+    paths.add(str((skill_path / CACHE_FILE).with_suffix(".tmp")))
+
+    output_dir = output_dir.resolve()
+    if skill_path in output_dir.parents:
+        paths.add(str(output_dir))
+    return paths
+
+
+def describe_changes(previous: dict, current: dict) -> str:
+    """Summarize how a fingerprint differs from the cached one."""
+    added = len(current.keys() - previous.keys())
+    removed = len(previous.keys() - current.keys())
+    changed = sum(
+        1 for rel in current.keys() & previous.keys()
+        if current[rel][2:] != previous[rel][2:]
+    )
+    return f"{changed} changed, {added} added, {removed} removed"
+
+
+def is_cache_hit(entry: dict, files: dict, level: int) -> bool:
+    """True if the cached archive still exists and matches the sources."""
+    if not entry or entry.get("level") != level:
+        return False
+
+    try:
+        st = Path(entry["zip"]).stat()
+    except OSError:
+        return False
+    if st.st_size != entry["zip_size"] or st.st_mtime_ns != entry["zip_mtime_ns"]:
+        return False
+
+    previous = entry["files"]
+    if previous.keys() != files.keys():
+        return False
+    # Content and exec bit: either one changes the archived entry
+    return all(files[rel][2:] == previous[rel][2:] for rel in files)
+
+
+def package_skill(skill_path: Path, output_dir: Path, force: bool = False,
+                  cache: BuildCache = None, level: int = DEFAULT_LEVEL,
+                  workers: int = 1, timings: Timings = None, store: BlobStore = None,
+                  delta_from: Path = None) -> bool:
+    """Package skill into a .zip file.
+
+    Unchanged skills are skipped using the build cache in output_dir
+    unless force is set. Pass a shared cache to package several skills
+    and save it once. workers > 1 compresses files in parallel. Pass
+    timings to record how long each phase takes, and a BlobStore to
+    reuse compressed data for files seen in earlier builds. A
+    <name>.manifest.json of file hashes is written next to the .zip;
+    with delta_from, a <name>.delta.zip against that older package is
+    written too.
+    """
 
     skill_path = skill_path.resolve()
+    timings = timings or Timings()
 
     if not skill_path.exists():
         print(f"❌ Skill path does not exist: {skill_path}")
         return False
 
     # Validate before packaging
-    if not validate_before_package(skill_path):
+    with timings.phase("validate") as phase:
+        phase["files"] = 1
+        valid = validate_before_package(skill_path)
+    if not valid:
         print("\n⚠️  Skill validation failed. Fix errors before packaging.")
         return False
 
-    # Get skill name
-    skill_md = skill_path / "SKILL.md"
-    with open(skill_md) as f:
-        content = f.read()
-        lines = content.split("\n")
-        end_idx = next(i for i in range(1, len(lines)) if lines[i] == "---")
-        frontmatter = yaml.safe_load("\n".join(lines[1:end_idx]))
-        skill_name = frontmatter["name"]
+    # Get skill name (served from the cache filled during validation)
+    skill_name = read_frontmatter(skill_path / "SKILL.md")["name"]
 
     # Create output directory
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Create zip file
-    zip_path = output_dir / skill_name
-    try:
-        # shutil.make_archive creates a .zip automatically
-        shutil.make_archive(
-            str(zip_path),
-            "zip",
-            skill_path,
-            "."
+    own_cache = cache is None
+    if own_cache:
+        cache = BuildCache(output_dir)
+
+    zip_file = output_dir / f"{skill_name}.zip"
+    entry = cache.lookup(skill_path)
+
+    if delta_from is not None and delta_from.resolve() == zip_file.resolve():
+        # The build would replace the base before the delta is taken
+        print(f"❌ --delta-from {delta_from} is the package being built; "
+              f"copy the previous package elsewhere or use another output directory")
+        return False
+
+    with timings.phase("walk") as phase:
+        entries = walk_skill(skill_path, exclude=output_paths(skill_path, output_dir, skill_name))
+        phase["files"] = len(entries)
+
+    with timings.phase("fingerprint") as phase:
+        previous = entry.get("files", {})
+        files = fingerprint_skill(skill_path, previous, entries)
+        # Only files whose size or mtime changed were actually hashed
+        phase["files"] = len(files)
+        phase["bytes_read"] = sum(
+            size for rel, (size, mtime_ns, *_) in files.items()
+            if previous.get(rel, [None, None])[:2] != [size, mtime_ns]
         )
 
-        zip_file = output_dir / f"{skill_name}.zip"
-        print(f"✅ Skill packaged successfully!")
+    if not force and is_cache_hit(entry, files, level):
+        cache.hits += 1
+        print(f"♻️  Cache hit: {skill_name} unchanged, skipping")
         print(f"📦 Output: {zip_file}")
+        if not manifest_path(zip_file).exists():
+            write_manifest(zip_file, {rel: digest for rel, (_, _, digest, _) in files.items()})
+        return delta_from is None or package_delta(delta_from, zip_file)
+
+    cache.misses += 1
+    if force:
+        print(f"🔨 Cache bypassed (--force): rebuilding {skill_name}")
+    elif entry and entry.get("level") != level:
+        print(f"🔨 Cache miss: {skill_name} (compression level changed)")
+    elif entry:
+        print(f"🔨 Cache miss: {skill_name} ({describe_changes(entry['files'], files)})")
+    else:
+        print(f"🔨 Cache miss: {skill_name} (not built before)")
+
+    # Create zip file
+    try:
+        with timings.phase("compress") as compress:
+            writer = write_skill_archive(
+                skill_path, zip_file, level, workers,
+                entries=[(e.arcname, e.path, e.is_dir) for e in entries],
+                store=store,
+                digests={rel: digest for rel, (_, _, digest, _) in files.items()},
+            )
+        # Report time blocked on disk writes as its own phase
+        compress["wall_ms"] -= writer.write_seconds * 1000
+        compress["files"] = len(writer.central)
+        compress["bytes_read"] = writer.bytes_in
+        compress["compression_ratio"] = round(writer.bytes_out / writer.bytes_in, 4) if writer.bytes_in else 1.0
+        timings.add("disk_write", writer.write_seconds * 1000,
+                    bytes_written=zip_file.stat().st_size)
+
+        cache.store(skill_path, zip_file, files, level)
+        if own_cache:
+            cache.save()
+        write_manifest(zip_file, {rel: digest for rel, (_, _, digest, _) in files.items()})
+
+        ratio = writer.bytes_out / writer.bytes_in if writer.bytes_in else 1.0
+        print(f"✅ Skill packaged successfully!")
+        print(f"📦 Output: {zip_file} ({len(writer.central)} entries, {ratio:.0%} of original size)")
         print(f"\n🚀 To install in Claude Code:")
         print(f"   /plugin install {zip_file}")
-        return True
+        return delta_from is None or package_delta(delta_from, zip_file)
 
     except Exception as e:
         print(f"❌ Failed to package skill: {e}")
         return False
 
 
-def main():
+def package_delta(base_zip: Path, zip_file: Path) -> bool:
+    """Write <name>.delta.zip turning base_zip into the fresh zip_file."""
+
+    import zipfile
+
+    from skill_archive import ArchiveError
+    from skill_delta import DeltaError, create_delta, describe_delta
+
+    delta_zip = zip_file.with_suffix(".delta.zip")
+    try:
+        delta = create_delta(base_zip, zip_file, delta_zip)
+    except (OSError, ValueError, zipfile.BadZipFile, ArchiveError, DeltaError) as e:
+        print(f"❌ Failed to create delta: {e}")
+        return False
+    describe_delta(delta, delta_zip, zip_file)
+    return True
+
+
+def list_skill_files(skill_path: Path, output_dir: Path = Path(".")) -> bool:
+    """Print the files a package would contain, without building it."""
+
+    skill_path = skill_path.resolve()
+    if not skill_path.is_dir():
+        print(f"❌ Skill path does not exist: {skill_path}")
+        return False
+
+    total = 0
+    count = 0
+    try:
+        skill_name = read_frontmatter(skill_path / "SKILL.md").get("name") or skill_path.name
+    except (FrontmatterError, OSError):
+        skill_name = skill_path.name
+
+    for entry in walk_skill(skill_path, exclude=output_paths(skill_path, output_dir, skill_name)):
+        if entry.is_dir:
+            continue
+        print(f"{entry.size:>12,}  {entry.arcname}")
+        total += entry.size
+        count += 1
+
+    print(f"\n📦 {count} files, {total:,} bytes would be packaged")
+    return True
+
+
+def _package_in_worker(skill_path: Path, output_dir: Path, force: bool,
+                       level: int, entry: dict, store_root: Path = None) -> tuple:
+    """Package one skill in a worker process, capturing its output.
+
+    The worker gets its own cache holding just this skill's entry and
+    hands the updated entry back, so only the parent writes the cache.
+    Blob store counters are handed back the same way.
+    """
+
+    import io
+    from contextlib import redirect_stdout
+
+    key = str(skill_path.resolve())
+    cache = BuildCache(output_dir, load=False)
+    if entry:
+        cache.entries[key] = entry
+
+    store = BlobStore(store_root) if store_root else None
+
+    out = io.StringIO()
+    with redirect_stdout(out):
+        try:
+            ok = package_skill(skill_path, output_dir, force, cache, level, store=store)
+        except Exception as e:
+            print(f"❌ Failed to package skill: {e}")
+            ok = False
+
+    stats = store.stats() if store else None
+    return ok, out.getvalue(), cache.hits, cache.misses, cache.entries.get(key), stats
+
+
+def package_skills(skill_paths: list, output_dir: Path, force: bool = False,
+                   cache: BuildCache = None, level: int = DEFAULT_LEVEL,
+                   jobs: int = None, store: BlobStore = None) -> bool:
+    """Package several skills into output_dir at the same time."""
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    if cache is None:
+        cache = BuildCache(output_dir)
+
+    jobs = min(jobs or os.cpu_count() or 1, len(skill_paths)) or 1
+    keys = [str(path.resolve()) for path in skill_paths]
+    # Workers open the store themselves; it is shared through the filesystem
+    store_root = store.root.parent if store else None
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(_package_in_worker, path, output_dir, force, level,
+                            cache.lookup(Path(key)), store_root)
+            for path, key in zip(skill_paths, keys)
+        ]
+
+        failed = 0
+        # Report in input order so the log reads the same on every run
+        for path, key, future in zip(skill_paths, keys, futures):
+            ok, output, hits, misses, entry, stats = future.result()
+            print(f"\n── {path} ──")
+            print(output, end="")
+            cache.hits += hits
+            cache.misses += misses
+            if entry:
+                cache.entries[key] = entry
+            if stats:
+                store.merge(stats)
+            if not ok:
+                failed += 1
+
+    print(f"\n📦 {len(skill_paths) - failed}/{len(skill_paths)} skills packaged into {output_dir}")
+    return failed == 0
+
+
+def main(argv: list = None, prog: str = None):
     """Main entry point."""
     parser = argparse.ArgumentParser(
+        prog=prog,
         description="Package a skill into a distributable .zip file"
     )
 
     parser.add_argument(
         "skill_path",
-        help="Path to skill directory"
+        help="Path to skill directory (or root directory with --all)"
     )
 
     parser.add_argument(
@@ -122,9 +435,121 @@ def main():
         help="Output directory for .zip file (default: current directory)"
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild even if the build cache says nothing changed"
+    )
+
+    parser.add_argument(
+        "--level",
+        type=int,
+        choices=range(0, 10),
+        default=DEFAULT_LEVEL,
+        metavar="0-9",
+        help=f"Deflate compression level (default: {DEFAULT_LEVEL})"
+    )
+
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Package every skill (folder with a SKILL.md) under skill_path"
+    )
+
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help="Parallel workers: compression threads for one skill, "
+             "or skills packaged at once with --all (default: CPU count)"
+    )
+
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="Dry run: print the files that would be packaged and their total size"
+    )
+
+    parser.add_argument(
+        "--delta-from",
+        metavar="ZIP",
+        help="Also write <name>.delta.zip with only the changes since this older package"
+    )
+
+    parser.add_argument(
+        "--store",
+        metavar="DIR",
+        help="Reuse compressed file data from a content-addressed store shared across builds"
+    )
+
+    parser.add_argument(
+        "--store-max-mb",
+        type=int,
+        default=DEFAULT_MAX_MB,
+        help=f"Evict least recently used blobs above this size (default: {DEFAULT_MAX_MB})"
+    )
+
+    parser.add_argument(
+        "--timings",
+        nargs="?",
+        const="table",
+        choices=["table", "json"],
+        help="Print per-phase timings to stderr as a table or JSON lines (single skill)"
+    )
+
+    parser.add_argument(
+        "--profile",
+        metavar="FILE",
+        help="Write a cProfile dump of the run to FILE"
+    )
 
-    if package_skill(Path(args.skill_path), Path(args.output_dir)):
+    args = parser.parse_args(argv)
+
+    if args.delta_from and args.all:
+        parser.error("--delta-from packages a single skill")
+
+    if args.timings and args.all:
+        parser.error("--timings works on a single skill, not with --all")
+
+    if args.list:
+        sys.exit(0 if list_skill_files(Path(args.skill_path), Path(args.output_dir)) else 1)
+
+    output_dir = Path(args.output_dir)
+    cache = BuildCache(output_dir)
+
+    timings = Timings("package", args.skill_path) if args.timings else None
+    store = BlobStore(Path(args.store), args.store_max_mb * 1024 * 1024) if args.store else None
+
+    with profiled(args.profile):
+        if args.all:
+            from quick_validate import find_skills
+
+            skill_paths = find_skills(Path(args.skill_path))
+            if not skill_paths:
+                print(f"❌ No skills (SKILL.md) found under {args.skill_path}")
+                sys.exit(1)
+            ok = package_skills(skill_paths, output_dir, force=args.force, cache=cache,
+                                level=args.level, jobs=args.jobs, store=store)
+        else:
+            ok = package_skill(Path(args.skill_path), output_dir, force=args.force,
+                               cache=cache, level=args.level,
+                               workers=args.jobs or os.cpu_count() or 1,
+                               timings=timings, store=store,
+                               delta_from=Path(args.delta_from) if args.delta_from else None)
+    if cache.hits or cache.misses:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        cache.save()
+        print(f"\n📊 Build cache: {cache.hits} hit(s), {cache.misses} miss(es)")
+
+    if store:
+        kept = store.evict()
+        print(store.report())
+        print(f"   {format_bytes(kept)} stored (cap {args.store_max_mb} MB), {store.evicted} blob(s) evicted")
+
+    if timings:
+        timings.report(args.timings)
+
+    if ok:
         sys.exit(0)
     else:
         sys.exit(1)
@@ -4,82 +4,190 @@ Quick validation of a skill structure.
 
 Usage:
     python quick_validate.py ./my-skill
+    python quick_validate.py ./skills --all --workers 8
+    python quick_validate.py ./my-skill --daemon
+    python quick_validate.py ./skills --watch
+    python quick_validate.py ./dist/*.zip --verify
 """
 
 import argparse
+import os
 import sys
-import yaml
 from pathlib import Path
 
+from frontmatter import FrontmatterError, parse_frontmatter_lines, read_frontmatter
+from timings import Timings, profiled
 
-def validate_skill(skill_path: Path) -> bool:
-    """Validate skill structure and SKILL.md."""
+# Directories never worth descending into when discovering skills
+SKIP_DIRS = {".git", "node_modules", "__pycache__", "dist"}
+
+# Read size when verifying archive entries; bounds memory per entry
+ARCHIVE_CHUNK_SIZE = 1 << 20
+
+
+def check_frontmatter(frontmatter: dict) -> list:
+    """Return errors for missing or malformed required fields."""
+
+    errors = []
+
+    # Check required fields
+    if not frontmatter.get("name"):
+        errors.append("Missing required field: name")
+    else:
+        name = frontmatter["name"]
+        # Validate name format
+        if not all(c.islower() or c == '-' or c.isdigit() for c in name):
+            errors.append(
+                f"Invalid skill name '{name}' - must be lowercase with hyphens"
+            )
+
+    if not frontmatter.get("description"):
+        errors.append("Missing required field: description")
+
+    return errors
+
+
+def check_skill(skill_path: Path, verify: bool = False, timings: Timings = None) -> tuple:
+    """Validate a skill and return (errors, warnings) without printing.
+
+    skill_path may be a skill directory or a packaged .zip; verify only
+    applies to archives (see check_archive). Pass timings to record how
+    long each phase takes.
+    """
 
     errors = []
     warnings = []
+    timings = timings or Timings()
 
-    # Check if path exists
-    if not skill_path.exists():
-        print(f"❌ Path does not exist: {skill_path}")
-        return False
+    with timings.phase("stat"):
+        # Check if path exists
+        if not skill_path.exists():
+            errors.append(f"Path does not exist: {skill_path}")
+            return errors, warnings
 
-    # Check if SKILL.md exists
-    skill_md = skill_path / "SKILL.md"
-    if not skill_md.exists():
-        errors.append("SKILL.md not found (required)")
-        print(f"❌ {errors[-1]}")
-        return False
+        is_archive = skill_path.is_file() and skill_path.suffix.lower() == ".zip"
+
+        # Check if SKILL.md exists
+        skill_md = skill_path / "SKILL.md"
+        if not is_archive and not skill_md.exists():
+            errors.append("SKILL.md not found (required)")
+            return errors, warnings
+
+    if is_archive:
+        return check_archive(skill_path, verify, timings)
 
     # Parse and validate SKILL.md
+    with timings.phase("frontmatter") as phase:
+        phase["files"] = 1
+        try:
+            errors.extend(check_frontmatter(read_frontmatter(skill_md)))
+        except FrontmatterError as e:
+            errors.append(str(e))
+        except Exception as e:
+            errors.append(f"Error reading SKILL.md: {e}")
+
+    # Check directory structure
+    with timings.phase("structure"):
+        if (skill_path / "scripts").exists() and not any((skill_path / "scripts").iterdir()):
+            warnings.append("scripts/ directory is empty")
+
+        if (skill_path / "references").exists() and not any((skill_path / "references").iterdir()):
+            warnings.append("references/ directory is empty")
+
+    return errors, warnings
+
+
+def check_archive(zip_path: Path, verify: bool = False, timings: Timings = None) -> tuple:
+    """Validate a packaged skill without extracting it.
+
+    Only the central directory and SKILL.md are read. With verify, every
+    entry is also streamed through its CRC check in fixed-size chunks.
+    """
+
+    import io
+    import zipfile
+    import zlib
+
+    errors = []
+    warnings = []
+    timings = timings or Timings()
+
     try:
-        with open(skill_md, "r") as f:
-            content = f.read()
+        with timings.phase("central_directory") as phase:
+            zf = zipfile.ZipFile(zip_path)
+            names = zf.namelist()
+            phase["files"] = len(names)
 
-        # Extract frontmatter
-        if not content.startswith("---"):
-            errors.append("SKILL.md must start with YAML frontmatter (---)")
-        else:
-            # Find end of frontmatter
-            lines = content.split("\n")
-            end_idx = None
-            for i in range(1, len(lines)):
-                if lines[i] == "---":
-                    end_idx = i
-                    break
-
-            if end_idx is None:
-                errors.append("Invalid YAML frontmatter (missing closing ---)")
+        with zf:
+
+            # Skill files sit at the archive root or inside one top-level folder
+            if "SKILL.md" in names:
+                prefix = ""
             else:
-                frontmatter_str = "\n".join(lines[1:end_idx])
+                nested = [name for name in names if name.count("/") == 1 and name.endswith("/SKILL.md")]
+                prefix = nested[0][:-len("SKILL.md")] if len(nested) == 1 else None
+
+            if prefix is None:
+                errors.append("SKILL.md not found (required)")
+                return errors, warnings
+
+            with timings.phase("frontmatter") as phase:
+                phase["files"] = 1
                 try:
-                    frontmatter = yaml.safe_load(frontmatter_str)
+                    with zf.open(prefix + "SKILL.md") as raw:
+                        frontmatter = parse_frontmatter_lines(io.TextIOWrapper(raw, encoding="utf-8"))
+                    errors.extend(check_frontmatter(frontmatter))
+                except FrontmatterError as e:
+                    errors.append(str(e))
+                except Exception as e:
+                    errors.append(f"Error reading SKILL.md: {e}")
 
-                    # Check required fields
-                    if not frontmatter.get("name"):
-                        errors.append("Missing required field: name")
-                    else:
-                        name = frontmatter["name"]
-                        # Validate name format
-                        if not all(c.islower() or c == '-' or c.isdigit() for c in name):
-                            errors.append(
-                                f"Invalid skill name '{name}' - must be lowercase with hyphens"
-                            )
+            # Check directory structure from the entry list
+            with timings.phase("structure"):
+                for dirname in ("scripts", "references"):
+                    dir_prefix = f"{prefix}{dirname}/"
+                    children = [name for name in names if name.startswith(dir_prefix)]
+                    if children and all(name == dir_prefix for name in children):
+                        warnings.append(f"{dirname}/ directory is empty")
 
-                    if not frontmatter.get("description"):
-                        errors.append("Missing required field: description")
+            if verify:
+                with timings.phase("verify") as phase:
+                    phase["files"] = 0
+                    phase["bytes_read"] = 0
+                    for info in zf.infolist():
+                        if info.is_dir():
+                            continue
+                        phase["files"] += 1
+                        phase["bytes_read"] += info.compress_size
+                        try:
+                            with zf.open(info) as f:
+                                while f.read(ARCHIVE_CHUNK_SIZE):
+                                    pass
+                        except (zipfile.BadZipFile, zlib.error, EOFError) as e:
+                            errors.append(f"Corrupt entry {info.filename}: {e}")
 
-                except yaml.YAMLError as e:
-                    errors.append(f"Invalid YAML: {e}")
+    except zipfile.BadZipFile as e:
+        errors.append(f"Invalid zip archive: {e}")
 
-    except Exception as e:
-        errors.append(f"Error reading SKILL.md: {e}")
+    return errors, warnings
 
-    # Check directory structure
-    if (skill_path / "scripts").exists() and not list((skill_path / "scripts").glob("*")):
-        warnings.append("scripts/ directory is empty")
 
-    if (skill_path / "references").exists() and not list((skill_path / "references").glob("*")):
-        warnings.append("references/ directory is empty")
+def validate_skill(skill_path: Path, use_daemon: bool = False, verify: bool = False,
+                   timings: Timings = None) -> bool:
+    """Validate skill structure and SKILL.md.
+
+    With use_daemon, the check is forwarded to a running validation
+    daemon (see validate_daemon.py), falling back to validating here.
+    The daemon neither verifies CRCs nor records timings, so verify or
+    timings always validate here.
+    """
+
+    result = None
+    if use_daemon and not verify and timings is None:
+        from validate_daemon import request_validation
+
+        result = request_validation(skill_path)
+    errors, warnings = result if result is not None else check_skill(skill_path, verify, timings)
 
     # Print results
     if errors:
@@ -98,21 +206,204 @@ def validate_skill(skill_path: Path) -> bool:
     return True
 
 
-def main():
+def find_skills(root: Path) -> list:
+    """Find every directory under root that contains a SKILL.md."""
+
+    skills = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        if "SKILL.md" in filenames:
+            skills.append(Path(dirpath))
+            # A skill's own subfolders are not separate skills
+            dirnames[:] = []
+            continue
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+
+    return sorted(skills)
+
+
+def _check_skill_entry(skill_path: Path, verify: bool = False) -> tuple:
+    """Worker entry point: never let one bad skill take down the pool."""
+
+    try:
+        errors, warnings = check_skill(skill_path, verify)
+    except Exception as e:
+        errors, warnings = [f"Unexpected error: {e}"], []
+    return skill_path, errors, warnings
+
+
+def check_skills(skills: list, workers: int = None, verify: bool = False) -> list:
+    """Check many skills in a process pool, returning (path, errors, warnings)."""
+
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(skills))
+
+    if workers <= 1:
+        return [_check_skill_entry(skill, verify) for skill in skills]
+
+    from concurrent.futures import ProcessPoolExecutor
+    from functools import partial
+
+    # Batch skills per task so IPC overhead stays small on big trees
+    chunksize = max(1, len(skills) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(partial(_check_skill_entry, verify=verify), skills, chunksize=chunksize))
+
+
+def validate_tree(root: Path, workers: int = None) -> bool:
+    """Validate every skill under root in parallel and print a report."""
+
+    if not root.is_dir():
+        print(f"❌ Path does not exist: {root}")
+        return False
+
+    skills = find_skills(root)
+    if not skills:
+        print(f"❌ No skills (SKILL.md) found under {root}")
+        return False
+
+    return report_results(check_skills(skills, workers), root)
+
+
+def validate_many(paths: list, workers: int = None, verify: bool = False) -> bool:
+    """Validate several skill directories or archives in parallel."""
+    return report_results(check_skills(paths, workers, verify))
+
+
+def report_results(results: list, root: Path = None) -> bool:
+    """Print an aggregated report for check_skills() results."""
+
+    failed = 0
+    warned = 0
+    for skill_path, errors, warnings in results:
+        try:
+            label = skill_path.relative_to(root) if root else skill_path
+        except ValueError:
+            label = skill_path
+
+        if errors:
+            failed += 1
+            print(f"❌ {label}")
+            for err in errors:
+                print(f"  • {err}")
+        if warnings:
+            warned += 1
+            if not errors:
+                print(f"⚠️  {label}")
+            for warn in warnings:
+                print(f"  • {warn}")
+
+    passed = len(results) - failed
+    print(f"\n📊 {len(results)} skills checked: {passed} passed, {failed} failed, {warned} with warnings")
+
+    if failed:
+        print("❌ Validation failed")
+        return False
+
+    print("✅ All skills passed validation!")
+    return True
+
+
+def main(argv: list = None, prog: str = None):
     """Main entry point."""
     parser = argparse.ArgumentParser(
+        prog=prog,
         description="Validate a skill structure"
     )
 
     parser.add_argument(
-        "path",
-        help="Path to skill directory"
+        "paths",
+        nargs="+",
+        metavar="path",
+        help="Skill directory or packaged .zip (or root directory with --all / --watch)"
+    )
+
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Validate every skill (folder with a SKILL.md) under path"
+    )
+
+    parser.add_argument(
+        "--workers", "-j",
+        type=int,
+        default=None,
+        help="Worker processes for several paths, --all and --watch (default: CPU count)"
+    )
+
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Forward to the validation daemon if one is running"
+    )
+
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Validate every skill under path, then revalidate skills as they change"
+    )
+
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="With --watch, poll for changes instead of using inotify"
+    )
+
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="Polling interval in seconds for --watch --poll (default: 1.0)"
+    )
+
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="For .zip archives, also check every entry's CRC"
     )
 
-    args = parser.parse_args()
-    skill_path = Path(args.path)
+    parser.add_argument(
+        "--timings",
+        nargs="?",
+        const="table",
+        choices=["table", "json"],
+        help="Print per-phase timings to stderr as a table or JSON lines (single path)"
+    )
+
+    parser.add_argument(
+        "--profile",
+        metavar="FILE",
+        help="Write a cProfile dump of the run to FILE"
+    )
+
+    args = parser.parse_args(argv)
+    paths = [Path(path) for path in args.paths]
+    skill_path = paths[0]
+
+    if (args.watch or args.all) and len(paths) > 1:
+        parser.error("--all and --watch take a single root directory")
+
+    if args.timings and (args.watch or args.all or len(paths) > 1 or args.daemon):
+        parser.error("--timings works on a single path without --all, --watch or --daemon")
+
+    timings = Timings("validate", str(skill_path)) if args.timings else None
+
+    with profiled(args.profile):
+        if args.watch:
+            from skill_watch import watch_skills
+
+            ok = watch_skills(skill_path, args.workers, args.poll, args.interval)
+        elif args.all:
+            ok = validate_tree(skill_path, args.workers)
+        elif len(paths) > 1:
+            ok = validate_many(paths, args.workers, args.verify)
+        else:
+            ok = validate_skill(skill_path, use_daemon=args.daemon, verify=args.verify,
+                                timings=timings)
+
+    if timings:
+        timings.report(args.timings)
 
-    if validate_skill(skill_path):
+    if ok:
         sys.exit(0)
     else:
         sys.exit(1)
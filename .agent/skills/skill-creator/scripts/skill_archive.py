@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+"""
+Deterministic, streaming zip writer for skill packages.
+
+Entries are written in sorted order with a fixed timestamp and normalized
+permissions, so identical inputs always produce byte-identical archives.
+Already-compressed files are stored instead of deflated.
+
+Usage:
+    from skill_archive import write_skill_archive
+    write_skill_archive(Path("./my-skill"), Path("./dist/my-skill.zip"))
+"""
+
+import hashlib
+import os
+import struct
+import time
+import zlib
+from pathlib import Path
+
+from skill_ignore import walk_skill
+
+STORED = 0
+DEFLATED = 8
+
+DEFAULT_LEVEL = 6
+CHUNK_SIZE = 1 << 20
+SAMPLE_SIZE = 64 * 1024
+
+# Cap on uncompressed bytes queued in the parallel writer
+MAX_IN_FLIGHT = 256 * 1024 * 1024
+
+# Store if deflating a sample saves less than this fraction
+MIN_SAVINGS = 0.05
+
+# Formats that are already compressed; deflating them only burns CPU
+INCOMPRESSIBLE_EXTENSIONS = {
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".ico",
+    ".zip", ".gz", ".tgz", ".bz2", ".xz", ".zst", ".7z", ".rar",
+    ".mp3", ".mp4", ".m4a", ".ogg", ".webm", ".mov",
+    ".woff", ".woff2", ".jar", ".whl",
+}
+
+# 1980-01-01 00:00:00, the earliest DOS timestamp
+DOS_TIME = 0
+DOS_DATE = (0 << 9) | (1 << 5) | 1
+
+FILE_MODE = 0o100644
+EXEC_MODE = 0o100755
+DIR_MODE = 0o040755
+
+LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+CENTRAL_HEADER = struct.Struct("<IHHHHHHIIIHHHHHII")
+END_RECORD = struct.Struct("<IHHHHIIH")
+
+LOCAL_SIGNATURE = 0x04034B50
+CENTRAL_SIGNATURE = 0x02014B50
+END_SIGNATURE = 0x06054B50
+
+# Made by UNIX (3), spec version 2.0
+VERSION_MADE_BY = (3 << 8) | 20
+UTF8_FLAG = 0x800
+ZIP32_LIMIT = 0xFFFFFFFF
+
+
+class ArchiveError(Exception):
+    """Raised when an archive cannot be written."""
+
+
+def collect_entries(skill_path: Path) -> list:
+    """Return sorted (arcname, path, is_dir) tuples for a skill directory.
+
+    Files excluded by the skill's .gitignore / .skillignore are skipped.
+    """
+    return [(entry.arcname, entry.path, entry.is_dir) for entry in walk_skill(skill_path)]
+
+
+def hash_file(path: Path) -> str:
+    """Return the sha256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def looks_incompressible(arcname: str, sample: bytes) -> bool:
+    """Guess whether deflate is worth it, by extension or a quick trial."""
+
+    if Path(arcname).suffix.lower() in INCOMPRESSIBLE_EXTENSIONS:
+        return True
+    if not sample:
+        return False
+
+    # A fast level-1 pass over the sample is a cheap entropy estimate
+    compressed = zlib.compress(sample, 1)
+    return len(compressed) > len(sample) * (1 - MIN_SAVINGS)
+
+
+def file_mode(path: Path) -> int:
+    """Normalize permissions: executable files keep their exec bit only."""
+    return EXEC_MODE if os.stat(path).st_mode & 0o111 else FILE_MODE
+
+
+def encode_bytes(arcname: str, data: bytes, level: int) -> tuple:
+    """Encode a whole file held in memory, returning (method, crc, payload)."""
+    crc = zlib.crc32(data)
+    if not looks_incompressible(arcname, data[:SAMPLE_SIZE]):
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        deflated = compressor.compress(data) + compressor.flush()
+        if len(deflated) < len(data):
+            return DEFLATED, crc, deflated
+    return STORED, crc, data
+
+
+def stream_file(f, head: bytes, method: int, level: int, write) -> tuple:
+    """Encode the rest of an open file chunk by chunk, passing output to write.
+
+    Returns (crc, compressed_size, uncompressed_size).
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15) if method == DEFLATED else None
+
+    crc = 0
+    usize = 0
+    csize = 0
+    chunk = head
+    while chunk:
+        crc = zlib.crc32(chunk, crc)
+        usize += len(chunk)
+        out = compressor.compress(chunk) if compressor else chunk
+        write(out)
+        csize += len(out)
+        chunk = f.read(CHUNK_SIZE)
+    if compressor:
+        out = compressor.flush()
+        write(out)
+        csize += len(out)
+
+    return crc, csize, usize
+
+
+def compress_file(arcname: str, path: Path, level: int) -> tuple:
+    """Encode a file in memory, returning (method, crc, usize, payload, mode).
+
+    Produces exactly the bytes ArchiveWriter.add_file would write, so
+    entries compressed in a worker pool match a single-threaded build.
+    """
+    mode = file_mode(path)
+    with open(path, "rb") as f:
+        head = f.read(SAMPLE_SIZE)
+        if len(head) < SAMPLE_SIZE:
+            method, crc, payload = encode_bytes(arcname, head, level)
+            return method, crc, len(head), payload, mode
+
+        method = STORED if looks_incompressible(arcname, head) else DEFLATED
+        chunks = []
+        crc, _, usize = stream_file(f, head, method, level, chunks.append)
+
+    return method, crc, usize, b"".join(chunks), mode
+
+
+def uses_store(arcname: str, store, digests: dict) -> bool:
+    """True if an entry should go through the blob store.
+
+    Files with incompressible extensions are stored verbatim, so caching
+    them would save no CPU and only duplicate their bytes.
+    """
+    return (
+        store is not None
+        and arcname in digests
+        and Path(arcname).suffix.lower() not in INCOMPRESSIBLE_EXTENSIONS
+    )
+
+
+def compress_cached(arcname: str, path: Path, level: int, store, digest: str) -> tuple:
+    """compress_file() through the blob store; returns (hit, encoded entry)."""
+    blob = store.get(digest, level)
+    if blob is not None:
+        return True, (*blob, file_mode(path))
+
+    method, crc, usize, payload, mode = compress_file(arcname, path, level)
+    if method == DEFLATED:
+        store.put(digest, level, method, crc, usize, payload)
+    return False, (method, crc, usize, payload, mode)
+
+
+def record_store_use(store, hit: bool, encoded: tuple) -> None:
+    """Count a lookup that saved (or could later save) compression work."""
+    if hit or encoded[0] == DEFLATED:
+        store.record(hit, encoded[2])
+
+
+def read_raw_payload(source, info) -> bytes:
+    """Read an entry's stored (still compressed) bytes from an open archive."""
+    source.seek(info.header_offset)
+    header = source.read(LOCAL_HEADER.size)
+    if len(header) != LOCAL_HEADER.size or LOCAL_HEADER.unpack(header)[0] != LOCAL_SIGNATURE:
+        raise ArchiveError(f"Bad local header for {info.filename}")
+    name_length, extra_length = LOCAL_HEADER.unpack(header)[9:]
+    source.seek(name_length + extra_length, os.SEEK_CUR)
+    payload = source.read(info.compress_size)
+    if len(payload) != info.compress_size:
+        raise ArchiveError(f"Truncated data for {info.filename}")
+    return payload
+
+
+class ArchiveWriter:
+    """Write a zip archive entry by entry, streaming file contents.
+
+    Local headers are written with placeholder sizes and patched once the
+    entry's data is written, so memory use is bounded by CHUNK_SIZE
+    regardless of file size. The output file must be seekable.
+    """
+
+    def __init__(self, path: Path, level: int = DEFAULT_LEVEL):
+        self.path = Path(path)
+        self.level = level
+        self.fp = open(self.path, "wb")
+        self.central = []
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.write_seconds = 0.0
+
+    def _write(self, data: bytes) -> None:
+        """Write to the archive, tracking time spent on disk I/O."""
+        start = time.perf_counter()
+        self.fp.write(data)
+        self.write_seconds += time.perf_counter() - start
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.fp.close()
+
+    def _write_local_header(self, name: bytes, flags: int, method: int,
+                            crc: int = 0, csize: int = 0, usize: int = 0) -> int:
+        offset = self.fp.tell()
+        if offset > ZIP32_LIMIT:
+            raise ArchiveError("Archive exceeds 4 GiB (zip64 is not supported)")
+        version = 20 if method == DEFLATED else 10
+        self._write(LOCAL_HEADER.pack(
+            LOCAL_SIGNATURE, version, flags, method, DOS_TIME, DOS_DATE,
+            crc, csize, usize, len(name), 0,
+        ))
+        self._write(name)
+        return offset
+
+    def _record(self, name: bytes, flags: int, method: int, crc: int,
+                csize: int, usize: int, mode: int, offset: int) -> None:
+        if csize > ZIP32_LIMIT or usize > ZIP32_LIMIT:
+            raise ArchiveError("Entry exceeds 4 GiB (zip64 is not supported)")
+        external = mode << 16
+        if mode == DIR_MODE:
+            external |= 0x10  # MS-DOS directory attribute
+        self.central.append((name, flags, method, crc, csize, usize, external, offset))
+        self.bytes_out += csize
+
+    @staticmethod
+    def _encode(arcname: str) -> tuple:
+        try:
+            return arcname.encode("ascii"), 0
+        except UnicodeEncodeError:
+            return arcname.encode("utf-8"), UTF8_FLAG
+
+    def add_dir(self, arcname: str) -> None:
+        """Add an empty directory entry (arcname must end with '/')."""
+        name, flags = self._encode(arcname)
+        offset = self._write_local_header(name, flags, STORED)
+        self._record(name, flags, STORED, 0, 0, 0, DIR_MODE, offset)
+
+    def add_compressed(self, arcname: str, method: int, crc: int, usize: int,
+                       payload: bytes, mode: int = FILE_MODE) -> None:
+        """Add an entry whose data was already encoded (see compress_file)."""
+        name, flags = self._encode(arcname)
+        offset = self._write_local_header(name, flags, method, crc, len(payload), usize)
+        self._write(payload)
+        self.bytes_in += usize
+        self._record(name, flags, method, crc, len(payload), usize, mode, offset)
+
+    def add_raw(self, source, info) -> None:
+        """Copy an entry from another archive without recompressing it.
+
+        source is the other archive opened in binary mode and info its
+        zipfile.ZipInfo; the entry is written exactly as add_file would.
+        """
+        if info.filename.endswith("/"):
+            self.add_dir(info.filename)
+            return
+        payload = read_raw_payload(source, info)
+        self.add_compressed(info.filename, info.compress_type, info.CRC, info.file_size,
+                            payload, info.external_attr >> 16)
+
+    def add_bytes(self, arcname: str, data: bytes, mode: int = FILE_MODE) -> None:
+        """Add an in-memory file, keeping whichever encoding is smaller."""
+        method, crc, payload = encode_bytes(arcname, data, self.level)
+        self.add_compressed(arcname, method, crc, len(data), payload, mode)
+
+    def add_file(self, arcname: str, path: Path) -> None:
+        """Add a file from disk, streaming it in chunks."""
+        mode = file_mode(path)
+        with open(path, "rb") as f:
+            head = f.read(SAMPLE_SIZE)
+            if len(head) < SAMPLE_SIZE:
+                # Small file: it is all in memory already
+                self.add_bytes(arcname, head, mode)
+                return
+
+            name, flags = self._encode(arcname)
+            method = STORED if looks_incompressible(arcname, head) else DEFLATED
+            offset = self._write_local_header(name, flags, method)
+            crc, csize, usize = stream_file(f, head, method, self.level, self._write)
+
+        # Patch crc and sizes into the local header
+        end = self.fp.tell()
+        self.fp.seek(offset + 14)
+        self._write(struct.pack("<III", crc, csize, usize))
+        self.fp.seek(end)
+
+        self.bytes_in += usize
+        self._record(name, flags, method, crc, csize, usize, mode, offset)
+
+    def close(self) -> None:
+        """Write the central directory and close the file."""
+        cd_offset = self.fp.tell()
+        for name, flags, method, crc, csize, usize, external, offset in self.central:
+            version = 20 if method == DEFLATED else 10
+            self._write(CENTRAL_HEADER.pack(
+                CENTRAL_SIGNATURE, VERSION_MADE_BY, version, flags, method,
+                DOS_TIME, DOS_DATE, crc, csize, usize, len(name),
+                0, 0, 0, 0, external, offset,
+            ))
+            self._write(name)
+        cd_size = self.fp.tell() - cd_offset
+
+        if len(self.central) > 0xFFFF or cd_offset > ZIP32_LIMIT:
+            raise ArchiveError("Too many entries or archive too large (zip64 is not supported)")
+        count = len(self.central)
+        self._write(END_RECORD.pack(END_SIGNATURE, 0, 0, count, count, cd_size, cd_offset, 0))
+        self.fp.close()
+
+
+def _write_entries(writer: ArchiveWriter, entries: list, store=None, digests: dict = None) -> None:
+    """Write entries one after another on the calling thread."""
+    for arcname, path, is_dir in entries:
+        if is_dir:
+            writer.add_dir(arcname)
+        elif uses_store(arcname, store, digests):
+            hit, encoded = compress_cached(arcname, path, writer.level, store, digests[arcname])
+            record_store_use(store, hit, encoded)
+            writer.add_compressed(arcname, *encoded)
+        else:
+            writer.add_file(arcname, path)
+
+
+def _write_entries_parallel(writer: ArchiveWriter, entries: list, workers: int,
+                            store=None, digests: dict = None) -> None:
+    """Compress entries in a thread pool, writing them in their fixed order.
+
+    zlib and file reads release the GIL, so threads compress in parallel
+    without copying data between processes. Known-incompressible files
+    are streamed straight from the writing thread. The number of files
+    (and bytes) in flight is capped to keep memory bounded.
+    """
+
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+
+    max_pending = workers * 2
+    pending = deque()
+    in_flight = 0
+    # digest -> future still queued, so duplicate files are compressed once
+    shared = {}
+
+    def encode(arcname, path):
+        if uses_store(arcname, store, digests):
+            return compress_cached(arcname, path, writer.level, store, digests[arcname])
+        return None, compress_file(arcname, path, writer.level)
+
+    def drain_one():
+        nonlocal in_flight
+        (arcname, path, is_dir), future, size, duplicate = pending.popleft()
+        if future is None:
+            if is_dir:
+                writer.add_dir(arcname)
+            else:
+                writer.add_file(arcname, path)
+            return
+        hit, encoded = future.result()
+        digest = digests.get(arcname) if digests else None
+        if shared.get(digest) is future:
+            del shared[digest]
+        if duplicate:
+            # Same bytes as an earlier entry; only the exec bit may differ
+            hit, encoded = True, (*encoded[:4], file_mode(path))
+        if hit is not None:
+            record_store_use(store, hit, encoded)
+        writer.add_compressed(arcname, *encoded)
+        in_flight -= size
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for entry in entries:
+            arcname, path, is_dir = entry
+            if is_dir or Path(arcname).suffix.lower() in INCOMPRESSIBLE_EXTENSIONS:
+                pending.append((entry, None, 0, False))
+            elif uses_store(arcname, store, digests) and digests[arcname] in shared:
+                pending.append((entry, shared[digests[arcname]], 0, True))
+            else:
+                size = os.stat(path).st_size
+                while pending and (len(pending) >= max_pending or in_flight + size > MAX_IN_FLIGHT):
+                    drain_one()
+                future = pool.submit(encode, arcname, path)
+                if uses_store(arcname, store, digests):
+                    shared[digests[arcname]] = future
+                pending.append((entry, future, size, False))
+                in_flight += size
+        while pending:
+            drain_one()
+
+
+def write_skill_archive(skill_path: Path, zip_file: Path, level: int = DEFAULT_LEVEL,
+                        workers: int = 1, entries: list = None, store=None,
+                        digests: dict = None) -> ArchiveWriter:
+    """Write a deterministic archive of skill_path to zip_file.
+
+    With workers > 1, file entries are compressed in parallel; the
+    output is byte-identical to a single-threaded build. Given a
+    BlobStore and {arcname: sha256} digests, files already compressed
+    at this level are copied from the store instead. The archive is
+    written to a temporary file and renamed into place, so a failed build
+    never leaves a truncated .zip behind.
+    """
+
+    if entries is None:
+        entries = collect_entries(skill_path)
+    tmp_file = zip_file.with_name(zip_file.name + ".tmp")
+    try:
+        with ArchiveWriter(tmp_file, level) as writer:
+            if workers > 1:
+                _write_entries_parallel(writer, entries, workers, store, digests)
+            else:
+                _write_entries(writer, entries, store, digests)
+        os.replace(tmp_file, zip_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+    return writer
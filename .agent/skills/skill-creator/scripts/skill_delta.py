@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Delta packages between two versions of a skill package.
+
+A delta holds only the entries whose stored bytes differ from the base
+(added, changed, or the same file compressed differently), plus a
+DELTA.json listing the target's entries, the removed files and the
+sha256 of both archives. Applying it to the base package copies every
+entry's compressed bytes (from the delta or the base) into a new
+archive, which is byte-identical to the full package and is verified
+against the expected hash.
+
+Per-file hashes come from the <name>.manifest.json that package_skill.py
+writes next to each .zip; for archives without one, the entries are
+decompressed and hashed instead.
+
+Usage:
+    python skill_delta.py create dist-v1/my-skill.zip dist-v2/my-skill.zip
+    python skill_delta.py apply my-skill.zip my-skill.delta.zip my-skill-new.zip
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+from skill_archive import ArchiveError, ArchiveWriter, hash_file, read_raw_payload
+
+MANIFEST_VERSION = 1
+DELTA_VERSION = 1
+DELTA_FILE = "DELTA.json"
+
+# Changed and added files are stored under this prefix in the delta
+PATCH_PREFIX = "files/"
+
+
+class DeltaError(Exception):
+    """Raised when a delta cannot be created or applied."""
+
+
+def manifest_path(zip_file: Path) -> Path:
+    """Sidecar manifest for an archive: my-skill.zip -> my-skill.manifest.json."""
+    return zip_file.with_suffix(".manifest.json")
+
+
+def write_manifest(zip_file: Path, files: dict, archive_sha256: str = None) -> dict:
+    """Record the archive hash and {arcname: sha256} of its files."""
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "archive": zip_file.name,
+        "archive_sha256": archive_sha256 or hash_file(zip_file),
+        "files": files,
+    }
+    path = manifest_path(zip_file)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+    return manifest
+
+
+def hash_archive_entries(zf) -> dict:
+    """Decompress and hash every file entry of an open zipfile."""
+    files = {}
+    for info in zf.infolist():
+        if info.filename.endswith("/"):
+            continue
+        digest = hashlib.sha256()
+        with zf.open(info) as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        files[info.filename] = digest.hexdigest()
+    return files
+
+
+def archive_files(zip_file: Path, zf, archive_sha256: str) -> dict:
+    """Per-file hashes from the manifest, or from the archive if it has none."""
+    try:
+        with open(manifest_path(zip_file)) as f:
+            manifest = json.load(f)
+        if (manifest.get("version") == MANIFEST_VERSION
+                and manifest.get("archive_sha256") == archive_sha256):
+            return manifest["files"]
+    except (OSError, ValueError, KeyError):
+        pass
+    # Missing or stale manifest: the archive itself is the source of truth
+    return hash_archive_entries(zf)
+
+
+def create_delta(base_zip: Path, target_zip: Path, delta_zip: Path) -> dict:
+    """Write a delta that turns base_zip into target_zip; returns DELTA.json."""
+
+    import zipfile
+
+    base_sha256 = hash_file(base_zip)
+    target_sha256 = hash_file(target_zip)
+
+    with zipfile.ZipFile(base_zip) as base, zipfile.ZipFile(target_zip) as target:
+        base_files = archive_files(base_zip, base, base_sha256)
+        target_files = archive_files(target_zip, target, target_sha256)
+
+        infos = target.infolist()
+        base_infos = {info.filename: info for info in base.infolist()}
+        # A permission change alone also needs the target's copy of the entry
+        changed = {
+            info.filename for info in infos
+            if info.filename in base_files
+            and (base_files[info.filename] != target_files.get(info.filename)
+                 or base_infos[info.filename].external_attr != info.external_attr)
+        }
+        added = {name for name in target_files if name not in base_files}
+        # Same content, different bytes (another level or an older packager):
+        # the base's copy would not rebuild the target, so ship the target's
+        with open(base_zip, "rb") as base_fp, open(target_zip, "rb") as target_fp:
+            reencoded = {
+                info.filename for info in infos
+                if info.filename in target_files
+                and info.filename not in added | changed
+                and not same_encoding(base_fp, base_infos[info.filename], target_fp, info)
+            }
+        patched = [info for info in infos if info.filename in added | changed | reencoded]
+        delta = {
+            "version": DELTA_VERSION,
+            "base_sha256": base_sha256,
+            "target_sha256": target_sha256,
+            "entries": [info.filename for info in infos],
+            "added": sorted(added),
+            "changed": sorted(changed),
+            "reencoded": sorted(reencoded),
+            "removed": sorted(name for name in base_files if name not in target_files),
+            "files": target_files,
+        }
+
+        tmp_file = delta_zip.with_name(delta_zip.name + ".tmp")
+        try:
+            with ArchiveWriter(tmp_file) as writer, open(target_zip, "rb") as source:
+                manifest = json.dumps(delta, sort_keys=True, separators=(",", ":"))
+                writer.add_bytes(DELTA_FILE, manifest.encode())
+                for info in patched:
+                    # Copy the target's compressed bytes under the patch prefix
+                    info.filename = PATCH_PREFIX + info.filename
+                    writer.add_raw(source, info)
+            # Refuse a delta that cannot be applied (e.g. a target not written by
+            # skill_archive), rather than failing later on every consumer
+            check_file = delta_zip.with_name(delta_zip.name + ".check.tmp")
+            try:
+                rebuild(base_zip, tmp_file, check_file, delta, target_sha256)
+            except DeltaError as e:
+                raise DeltaError(f"Refusing delta, it would not rebuild {target_zip.name}: {e}")
+            finally:
+                check_file.unlink(missing_ok=True)
+            os.replace(tmp_file, delta_zip)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
+    return delta
+
+
+def same_encoding(base_fp, base_info, target_fp, target_info) -> bool:
+    """True if two entries have identical compressed bytes and headers."""
+    if (base_info.compress_type, base_info.CRC, base_info.compress_size, base_info.file_size) != (
+            target_info.compress_type, target_info.CRC, target_info.compress_size, target_info.file_size):
+        return False
+    return read_raw_payload(base_fp, base_info) == read_raw_payload(target_fp, target_info)
+
+
+def rebuild(base_zip: Path, delta_zip: Path, output_zip: Path, delta: dict,
+            expected_sha256: str) -> str:
+    """Write the package described by delta to output_zip and check its hash."""
+
+    import zipfile
+
+    with zipfile.ZipFile(delta_zip) as patch, zipfile.ZipFile(base_zip) as base:
+        patch_infos = {
+            info.filename[len(PATCH_PREFIX):]: info
+            for info in patch.infolist() if info.filename.startswith(PATCH_PREFIX)
+        }
+        base_infos = {info.filename: info for info in base.infolist()}
+        with ArchiveWriter(output_zip) as writer, \
+                open(base_zip, "rb") as base_fp, open(delta_zip, "rb") as patch_fp:
+            for name in delta["entries"]:
+                if name.endswith("/"):
+                    writer.add_dir(name)
+                elif name in patch_infos:
+                    info = patch_infos[name]
+                    info.filename = name
+                    writer.add_raw(patch_fp, info)
+                elif name in base_infos:
+                    writer.add_raw(base_fp, base_infos[name])
+                else:
+                    raise DeltaError(f"Entry {name} is in neither the base nor the delta")
+
+    sha256 = hash_file(output_zip)
+    if sha256 != expected_sha256:
+        raise DeltaError(
+            f"Rebuilt package does not match the expected hash "
+            f"(expected {expected_sha256[:12]}, got {sha256[:12]})"
+        )
+    return sha256
+
+
+def apply_delta(base_zip: Path, delta_zip: Path, output_zip: Path,
+                expected_sha256: str = None) -> str:
+    """Rebuild the full package from base_zip and a delta; returns its sha256.
+
+    Raises DeltaError if the base is not the one the delta was made from
+    or the result does not match the expected hash (by default, the
+    target hash recorded in the delta).
+    """
+
+    import zipfile
+
+    with zipfile.ZipFile(delta_zip) as patch:
+        try:
+            delta = json.loads(patch.read(DELTA_FILE))
+        except KeyError:
+            raise DeltaError(f"{delta_zip} is not a skill delta (no {DELTA_FILE})")
+        if delta.get("version") != DELTA_VERSION:
+            raise DeltaError(f"Unsupported delta version: {delta.get('version')}")
+
+        base_sha256 = hash_file(base_zip)
+        if base_sha256 != delta["base_sha256"]:
+            raise DeltaError(
+                f"Base archive does not match the delta "
+                f"(expected {delta['base_sha256'][:12]}, got {base_sha256[:12]})"
+            )
+
+    expected_sha256 = expected_sha256 or delta["target_sha256"]
+    tmp_file = output_zip.with_name(output_zip.name + ".tmp")
+    try:
+        sha256 = rebuild(base_zip, delta_zip, tmp_file, delta, expected_sha256)
+        os.replace(tmp_file, output_zip)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+    write_manifest(output_zip, delta["files"], sha256)
+    return sha256
+
+
+def describe_delta(delta: dict, delta_zip: Path, target_zip: Path) -> None:
+    """Print what a delta contains and how it compares to the full package."""
+    delta_size = delta_zip.stat().st_size
+    full_size = target_zip.stat().st_size
+    print(f"✅ Delta written: {delta_zip}")
+    print(f"   {len(delta['added'])} added, {len(delta['changed'])} changed, "
+          f"{len(delta['removed'])} removed, {len(delta['reencoded'])} recompressed")
+    print(f"   {delta_size:,} bytes ({delta_size / full_size:.0%} of the "
+          f"{full_size:,}-byte full package)" if full_size else f"   {delta_size:,} bytes")
+
+
+def main(argv: list = None, prog: str = None):
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description="Create or apply delta packages between skill versions"
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    create = subparsers.add_parser("create", help="Make a delta from a base package to a new one")
+    create.add_argument("base", help="Previous package (.zip)")
+    create.add_argument("target", help="New package (.zip)")
+    create.add_argument("--output", "-o",
+                        help="Delta file (default: <target>.delta.zip next to the target)")
+
+    apply = subparsers.add_parser("apply", help="Rebuild a full package from a base and a delta")
+    apply.add_argument("base", help="Package the delta was made from (.zip)")
+    apply.add_argument("delta", help="Delta package (.delta.zip)")
+    apply.add_argument("output", help="Where to write the rebuilt package (.zip)")
+    apply.add_argument("--expect-sha256",
+                       help="Required hash of the result (default: the target hash in the delta)")
+
+    args = parser.parse_args(argv)
+
+    import zipfile
+
+    try:
+        if args.command == "create":
+            target = Path(args.target)
+            output = Path(args.output) if args.output else target.with_suffix(".delta.zip")
+            delta = create_delta(Path(args.base), target, output)
+            describe_delta(delta, output, target)
+        else:
+            sha256 = apply_delta(Path(args.base), Path(args.delta), Path(args.output),
+                                 args.expect_sha256)
+            print(f"✅ Rebuilt {args.output}")
+            print(f"   sha256 {sha256} verified")
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile, ArchiveError, DeltaError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
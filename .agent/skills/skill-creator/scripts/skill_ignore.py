@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Select the files that belong in a skill package.
+
+Honors the skill's .gitignore plus an optional .skillignore (same syntax,
+applied after .gitignore so it can re-include with !pattern). Patterns
+are compiled to regexes once, and ignored directories are pruned during
+a single os.scandir walk instead of being descended into.
+
+Usage:
+    from skill_ignore import walk_skill
+    for entry in walk_skill(Path("./my-skill")):
+        print(entry.arcname, entry.size)
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import NamedTuple
+
+IGNORE_FILES = (".gitignore", ".skillignore")
+
+# Never shipped, whatever the ignore files say
+ALWAYS_IGNORED = {".git", ".gitignore", ".skillignore", ".DS_Store"}
+
+
+class SkillFile(NamedTuple):
+    """One entry selected for packaging."""
+
+    arcname: str
+    path: Path
+    is_dir: bool
+    size: int
+    mtime_ns: int
+    executable: bool = False
+
+
+def translate_pattern(pattern: str) -> str:
+    """Translate a gitignore glob (without anchoring slashes) to a regex."""
+
+    out = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**/", i):
+                out.append("(?:.*/)?")
+                i += 3
+                continue
+            if pattern.startswith("**", i):
+                out.append(".*")
+                i += 2
+                continue
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append("[" + body.replace("\\", "\\\\") + "]")
+                i = end
+        elif c == "\\" and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 1
+        else:
+            out.append(re.escape(c))
+        i += 1
+
+    return "".join(out)
+
+
+class IgnoreRules:
+    """Compiled gitignore-style rules; the last matching rule wins."""
+
+    def __init__(self, lines: list = ()):
+        self.rules = []
+        for line in lines:
+            self.add(line)
+
+    def add(self, line: str) -> None:
+        """Compile one ignore-file line (comments and blanks are skipped)."""
+        line = line.rstrip("\r\n")
+        if not line.endswith("\\ "):
+            line = line.rstrip()
+        if not line or line.startswith("#"):
+            return
+
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        elif line.startswith("\\"):
+            line = line[1:]
+
+        dir_only = line.endswith("/")
+        if dir_only:
+            line = line[:-1]
+
+        # A slash anywhere but the end anchors the pattern to the skill root
+        if "/" in line:
+            regex = "^" + translate_pattern(line.lstrip("/")) + "$"
+        else:
+            regex = "^(?:.*/)?" + translate_pattern(line) + "$"
+
+        self.rules.append((re.compile(regex), negate, dir_only))
+
+    def is_ignored(self, rel: str, is_dir: bool) -> bool:
+        """True if the path (posix, relative to the skill) is ignored."""
+        for regex, negate, dir_only in reversed(self.rules):
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel):
+                return not negate
+        return False
+
+
+def load_ignore_rules(skill_path: Path) -> IgnoreRules:
+    """Read .gitignore and .skillignore from the skill root."""
+    rules = IgnoreRules()
+    for name in IGNORE_FILES:
+        try:
+            with open(skill_path / name, encoding="utf-8") as f:
+                for line in f:
+                    rules.add(line)
+        except FileNotFoundError:
+            continue
+    return rules
+
+
+def walk_skill(skill_path: Path, rules: IgnoreRules = None, exclude: set = frozenset()) -> list:
+    """Return the sorted SkillFile entries that should be packaged.
+
+    exclude holds absolute paths (as str) to leave out, such as the
+    packager's own output when it is written inside the skill.
+    """
+
+    if rules is None:
+        rules = load_ignore_rules(skill_path)
+
+    entries = []
+    stack = [(str(skill_path), "")]
+    while stack:
+        directory, prefix = stack.pop()
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name in ALWAYS_IGNORED or entry.path in exclude:
+                    continue
+                rel = prefix + entry.name
+                is_dir = entry.is_dir()
+                if rules.is_ignored(rel, is_dir):
+                    continue
+                st = entry.stat()
+                if is_dir:
+                    entries.append(SkillFile(rel + "/", Path(entry.path), True, 0, st.st_mtime_ns))
+                    # Like os.walk, list symlinked directories but do not follow them
+                    if not entry.is_symlink():
+                        stack.append((entry.path, rel + "/"))
+                else:
+                    entries.append(SkillFile(rel, Path(entry.path), False, st.st_size, st.st_mtime_ns,
+                                             bool(st.st_mode & 0o111)))
+
+    entries.sort(key=lambda entry: entry.arcname)
+    return entries
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Searchable SQLite index of a skill catalog.
+
+Records each skill's frontmatter (name, description, license), path,
+SKILL.md size and mtime, and validation status, with full-text search
+over names and descriptions. Refreshing only re-reads skills whose
+directory or SKILL.md changed since the last run.
+
+Usage:
+    python skill_index.py build ./skills
+    python skill_index.py search "pdf rotate"
+    python skill_index.py search pdf --name
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+from frontmatter import FrontmatterError, read_frontmatter
+from quick_validate import check_skill, find_skills
+
+DEFAULT_DB = ".skill-index.db"
+DEFAULT_LIMIT = 20
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS skills (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    name TEXT,
+    description TEXT,
+    license TEXT,
+    size INTEGER,
+    mtime_ns INTEGER,
+    dir_mtime_ns INTEGER,
+    valid INTEGER,
+    errors TEXT
+);
+CREATE INDEX IF NOT EXISTS skills_name ON skills(name);
+"""
+
+# External-content FTS table kept in sync with skills by triggers
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS skills_fts USING fts5(
+    name, description, content='skills', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS skills_ai AFTER INSERT ON skills BEGIN
+    INSERT INTO skills_fts(rowid, name, description) VALUES (new.id, new.name, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS skills_ad AFTER DELETE ON skills BEGIN
+    INSERT INTO skills_fts(skills_fts, rowid, name, description)
+    VALUES ('delete', old.id, old.name, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS skills_au AFTER UPDATE ON skills BEGIN
+    INSERT INTO skills_fts(skills_fts, rowid, name, description)
+    VALUES ('delete', old.id, old.name, old.description);
+    INSERT INTO skills_fts(rowid, name, description) VALUES (new.id, new.name, new.description);
+END;
+"""
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    """Open the index, creating tables on first use."""
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    try:
+        conn.executescript(FTS_SCHEMA)
+    except sqlite3.OperationalError:
+        # SQLite built without FTS5: search falls back to LIKE
+        pass
+    return conn
+
+
+def has_fts(conn: sqlite3.Connection) -> bool:
+    """True if the full-text table exists."""
+    row = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'skills_fts'").fetchone()
+    return row is not None
+
+
+def read_skill(skill_path: Path, dir_st, md_st) -> tuple:
+    """Build the row for one skill."""
+
+    try:
+        meta = read_frontmatter(skill_path / "SKILL.md")
+    except (FrontmatterError, OSError):
+        meta = {}
+
+    errors, _ = check_skill(skill_path)
+    return (
+        str(skill_path),
+        str(meta.get("name") or ""),
+        str(meta.get("description") or ""),
+        str(meta.get("license") or ""),
+        md_st.st_size,
+        md_st.st_mtime_ns,
+        dir_st.st_mtime_ns,
+        0 if errors else 1,
+        json.dumps(errors),
+    )
+
+
+def refresh_index(conn: sqlite3.Connection, root: Path, full: bool = False) -> dict:
+    """Bring the index up to date with root; returns change counts."""
+
+    root = root.resolve()
+    prefix = str(root) + os.sep
+    known = {
+        row["path"]: (row["mtime_ns"], row["size"], row["dir_mtime_ns"])
+        for row in conn.execute(
+            "SELECT path, mtime_ns, size, dir_mtime_ns FROM skills WHERE path = ? OR path LIKE ? ESCAPE '\\'",
+            (str(root), prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"),
+        )
+    }
+
+    stats = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0}
+    rows = []
+    found = set()
+    for skill_path in find_skills(root):
+        key = str(skill_path)
+        found.add(key)
+        try:
+            dir_st = os.stat(skill_path)
+            md_st = os.stat(skill_path / "SKILL.md")
+        except OSError:
+            continue
+
+        previous = known.get(key)
+        if not full and previous == (md_st.st_mtime_ns, md_st.st_size, dir_st.st_mtime_ns):
+            stats["unchanged"] += 1
+            continue
+
+        stats["updated" if previous else "added"] += 1
+        rows.append(read_skill(skill_path, dir_st, md_st))
+
+    removed = [(path,) for path in known if path not in found]
+    stats["removed"] = len(removed)
+
+    with conn:
+        conn.executemany(
+            """
+            INSERT INTO skills (path, name, description, license, size, mtime_ns, dir_mtime_ns, valid, errors)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(path) DO UPDATE SET
+                name = excluded.name, description = excluded.description,
+                license = excluded.license, size = excluded.size,
+                mtime_ns = excluded.mtime_ns, dir_mtime_ns = excluded.dir_mtime_ns,
+                valid = excluded.valid, errors = excluded.errors
+            """,
+            rows,
+        )
+        conn.executemany("DELETE FROM skills WHERE path = ?", removed)
+
+    return stats
+
+
+def fts_query(query: str) -> str:
+    """Turn free text into a safe FTS5 query: every term, prefix-matched."""
+    terms = [term.replace('"', '""') for term in query.split()]
+    return " ".join(f'"{term}"*' for term in terms if term)
+
+
+def search(conn: sqlite3.Connection, query: str, by_name: bool = False,
+           limit: int = DEFAULT_LIMIT) -> list:
+    """Find skills by name prefix or by keywords in name and description."""
+
+    if by_name:
+        return conn.execute(
+            "SELECT * FROM skills WHERE name >= ? AND name < ? ORDER BY name LIMIT ?",
+            (query, query + "\U0010ffff", limit),
+        ).fetchall()
+
+    if has_fts(conn) and fts_query(query):
+        return conn.execute(
+            """
+            SELECT skills.* FROM skills_fts
+            JOIN skills ON skills.id = skills_fts.rowid
+            WHERE skills_fts MATCH ?
+            ORDER BY bm25(skills_fts, 10.0, 1.0)
+            LIMIT ?
+            """,
+            (fts_query(query), limit),
+        ).fetchall()
+
+    pattern = f"%{query}%"
+    return conn.execute(
+        "SELECT * FROM skills WHERE name LIKE ? OR description LIKE ? ORDER BY name LIMIT ?",
+        (pattern, pattern, limit),
+    ).fetchall()
+
+
+def main(argv: list = None, prog: str = None):
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description="Build and search an index of skills"
+    )
+
+    parser.add_argument(
+        "--db",
+        default=DEFAULT_DB,
+        help=f"Index database (default: {DEFAULT_DB})"
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build = subparsers.add_parser("build", help="Create or refresh the index")
+    build.add_argument("root", help="Directory containing skills")
+    build.add_argument("--full", action="store_true", help="Re-read every skill, not just changed ones")
+
+    find = subparsers.add_parser("search", help="Search the index")
+    find.add_argument("query", help="Keywords (or a name prefix with --name)")
+    find.add_argument("--name", action="store_true", help="Match skill names by prefix")
+    find.add_argument("--limit", type=int, default=DEFAULT_LIMIT,
+                      help=f"Maximum results (default: {DEFAULT_LIMIT})")
+    find.add_argument("--json", action="store_true", help="Print results as JSON lines")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        root = Path(args.root)
+        if not root.is_dir():
+            print(f"❌ Path does not exist: {root}")
+            sys.exit(1)
+
+        start = time.perf_counter()
+        with connect(Path(args.db)) as conn:
+            stats = refresh_index(conn, root, args.full)
+            total = conn.execute("SELECT COUNT(*) FROM skills").fetchone()[0]
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"✅ Index refreshed in {elapsed:.0f} ms: {stats['added']} added, {stats['updated']} updated, "
+              f"{stats['removed']} removed, {stats['unchanged']} unchanged ({total} skills indexed)")
+        print(f"📇 Index: {args.db}")
+        sys.exit(0)
+
+    if not Path(args.db).exists():
+        print(f"❌ No index at {args.db}. Run: skill_index.py build <root>")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    with connect(Path(args.db)) as conn:
+        results = search(conn, args.query, args.name, args.limit)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    for row in results:
+        if args.json:
+            record = dict(row)
+            record["errors"] = json.loads(record["errors"] or "[]")
+            print(json.dumps(record))
+            continue
+        status = "✅" if row["valid"] else "❌"
+        print(f"{status} {row['name'] or '(unnamed)'}  {row['path']}")
+        if row["description"]:
+            print(f"    {row['description'][:160]}")
+
+    if not args.json:
+        print(f"\n🔎 {len(results)} result(s) in {elapsed:.1f} ms")
+    sys.exit(0 if results else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Watch a skills tree and revalidate only the skills that change.
+
+Uses inotify on Linux and falls back to polling elsewhere (or when the
+watch limit is hit). Only SKILL.md, scripts/ and references/ count as
+changes. Events are debounced and coalesced, so a checkout touching
+hundreds of skills triggers one batched revalidation.
+
+Usage:
+    python quick_validate.py ./skills --watch
+    python quick_validate.py ./skills --watch --poll --interval 2
+"""
+
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+from quick_validate import SKIP_DIRS, check_skills, find_skills
+
+# Paths inside a skill whose changes can affect validation
+RELEVANT = ("SKILL.md", "scripts", "references")
+
+DEFAULT_DEBOUNCE = 0.5
+DEFAULT_INTERVAL = 1.0
+MAX_BATCH_WAIT = 5.0
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+)
+
+EVENT_HEADER = struct.Struct("iIII")
+
+ENOENT = 2
+ENOTDIR = 20
+ENOSPC = 28
+
+
+class WatchLimitError(OSError):
+    """Raised when the inotify watch limit (max_user_watches) is reached."""
+
+
+def owning_skill(path: Path, skills: set, root: Path) -> Path:
+    """Return the known skill containing path (or None)."""
+    for parent in (path, *path.parents):
+        if parent in skills:
+            return parent
+        if parent == root:
+            break
+    return None
+
+
+def is_relevant(path: Path, skill: Path) -> bool:
+    """True if a change at path can affect the skill's validation."""
+    if path == skill:
+        return True
+    return path.relative_to(skill).parts[0] in RELEVANT
+
+
+class InotifyWatcher:
+    """Recursive inotify watches over the parts of the tree that matter."""
+
+    def __init__(self, root: Path, skills: set):
+        import ctypes
+        import ctypes.util
+
+        self.root = root
+        self.skills = skills
+        self.watches = {}
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._ctypes = ctypes
+
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.watch_tree(root)
+
+    def watch(self, directory: Path) -> None:
+        """Add a single directory watch."""
+        wd = self._add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            errno = self._ctypes.get_errno()
+            # The directory may vanish between listing and watching
+            if errno in (ENOENT, ENOTDIR):
+                return
+            if errno == ENOSPC:
+                raise WatchLimitError(errno, f"inotify watch limit reached at {directory}")
+            raise OSError(errno, f"inotify_add_watch failed for {directory}: {os.strerror(errno)}")
+        self.watches[wd] = directory
+
+    def watch_tree(self, top: Path) -> None:
+        """Watch top and the directories below it that can matter."""
+        for dirpath, dirnames, _ in os.walk(top):
+            directory = Path(dirpath)
+            self.watch(directory)
+            skill = owning_skill(directory, self.skills, self.root)
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            if directory == skill:
+                dirnames[:] = [d for d in dirnames if d in RELEVANT]
+
+    def poll(self, timeout: float) -> set:
+        """Wait up to timeout seconds; return skills that changed."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        dirty = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+                self.handle(wd, mask, os.fsdecode(name), dirty)
+
+        return dirty
+
+    def handle(self, wd: int, mask: int, name: str, dirty: set) -> None:
+        """Translate one inotify event into dirty skills."""
+        if mask & IN_Q_OVERFLOW:
+            # Events were dropped: fall back to revalidating everything
+            self.skills.update(find_skills(self.root))
+            dirty.update(self.skills)
+            return
+
+        directory = self.watches.get(wd)
+        if directory is None:
+            return
+        if mask & IN_IGNORED:
+            del self.watches[wd]
+            return
+
+        path = directory / name if name else directory
+        skill = owning_skill(path, self.skills, self.root)
+
+        if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO) and path.name not in SKIP_DIRS:
+            if skill is None:
+                # A new subtree (e.g. from a checkout) may bring new skills
+                for new_skill in find_skills(path):
+                    self.skills.add(new_skill)
+                    dirty.add(new_skill)
+                self.watch_tree(path)
+            elif is_relevant(path, skill):
+                # Only scripts/ and references/ matter inside a skill, so
+                # assets/ or node_modules/ never cost any watches
+                self.watch_tree(path)
+            skill = owning_skill(path, self.skills, self.root)
+
+        if skill is None:
+            if name == "SKILL.md":
+                self.skills.add(directory)
+                dirty.add(directory)
+            return
+
+        if is_relevant(path, skill):
+            dirty.add(skill)
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Portable fallback: compare stat snapshots on an interval.
+
+    Each poll stats the directories between root and the skills (to
+    notice skills being added or removed) and four paths per skill.
+    Validation only reads SKILL.md and checks whether scripts/ and
+    references/ exist and are empty, which their directory mtimes
+    reflect, so nothing below them is walked.
+    """
+
+    def __init__(self, root: Path, skills: set, interval: float = DEFAULT_INTERVAL):
+        self.root = root
+        self.skills = skills
+        self.interval = interval
+        self.tree = self.scan_tree()
+        self.snapshot = {skill: self.signature(skill) for skill in skills}
+
+    def scan_tree(self) -> dict:
+        """Walk root like find_skills; return {non-skill dir: mtime_ns}.
+
+        Newly found skills are added to self.skills.
+        """
+        tree = {}
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            if "SKILL.md" in filenames:
+                self.skills.add(Path(dirpath))
+                dirnames[:] = []
+                continue
+            try:
+                tree[dirpath] = os.stat(dirpath).st_mtime_ns
+            except OSError:
+                continue
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        return tree
+
+    def tree_changed(self) -> bool:
+        """True if any directory above the skills gained or lost entries."""
+        for directory, mtime_ns in self.tree.items():
+            try:
+                if os.stat(directory).st_mtime_ns != mtime_ns:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    @staticmethod
+    def signature(skill: Path) -> tuple:
+        """Stat the skill dir, SKILL.md, scripts/ and references/."""
+        entries = []
+        for path in (skill, skill / "SKILL.md", skill / "scripts", skill / "references"):
+            try:
+                st = os.stat(path)
+            except OSError:
+                entries.append(None)
+                continue
+            entries.append((st.st_mtime_ns, st.st_size))
+        return tuple(entries)
+
+    def poll(self, timeout: float) -> set:
+        """Sleep, then return skills whose snapshot changed."""
+        time.sleep(self.interval if timeout is None else timeout)
+
+        if self.tree_changed():
+            self.tree = self.scan_tree()
+
+        dirty = set()
+        for skill in list(self.skills):
+            signature = self.signature(skill)
+            if self.snapshot.get(skill) != signature:
+                self.snapshot[skill] = signature
+                dirty.add(skill)
+        for skill in set(self.snapshot) - self.skills:
+            del self.snapshot[skill]
+        return dirty
+
+    def close(self) -> None:
+        pass
+
+
+def make_watcher(root: Path, skills: set, force_poll: bool, interval: float):
+    """Prefer inotify; fall back to polling when it is unavailable."""
+    if not force_poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(root, skills)
+        except (OSError, AttributeError) as e:
+            print(f"⚠️  inotify unavailable ({e}), falling back to polling")
+    return PollingWatcher(root, skills, interval)
+
+
+def next_batch(watcher, debounce: float) -> set:
+    """Block until something changes, then coalesce until things go quiet."""
+    dirty = set()
+    while not dirty:
+        dirty |= watcher.poll(None)
+
+    deadline = time.monotonic() + MAX_BATCH_WAIT
+    while time.monotonic() < deadline:
+        more = watcher.poll(debounce)
+        if not more:
+            break
+        dirty |= more
+    return dirty
+
+
+def report_changes(root: Path, results: list, state: dict) -> None:
+    """Print skills whose pass/fail state changed and update state."""
+
+    for skill_path, errors, warnings in sorted(results, key=lambda result: result[0]):
+        label = skill_path.relative_to(root) if skill_path != root else skill_path
+        previous = state.get(skill_path)
+
+        if not skill_path.exists():
+            if previous is not None:
+                print(f"🗑️  {label}: removed")
+            state.pop(skill_path, None)
+            continue
+
+        passing = not errors
+        state[skill_path] = (passing, errors)
+        if previous is None:
+            print(f"{'✅' if passing else '❌'} {label}: new skill, {'passing' if passing else 'failing'}")
+        elif previous[0] and not passing:
+            print(f"❌ {label}: passing → failing")
+        elif not previous[0] and passing:
+            print(f"✅ {label}: failing → passing")
+        elif not passing and previous[1] != errors:
+            print(f"❌ {label}: still failing")
+        else:
+            continue
+
+        for err in errors:
+            print(f"  • {err}")
+
+
+def watch_skills(root: Path, workers: int = None, force_poll: bool = False,
+               interval: float = DEFAULT_INTERVAL, debounce: float = DEFAULT_DEBOUNCE) -> bool:
+    """Validate root once, then revalidate changed skills until interrupted."""
+
+    if not root.is_dir():
+        print(f"❌ Path does not exist: {root}")
+        return False
+
+    root = root.resolve()
+    skills = set(find_skills(root))
+    state = {}
+
+    results = check_skills(sorted(skills), workers)
+    for skill_path, errors, _ in results:
+        state[skill_path] = (not errors, errors)
+        if errors:
+            print(f"❌ {skill_path.relative_to(root)}")
+            for err in errors:
+                print(f"  • {err}")
+
+    failing = sum(1 for passing, _ in state.values() if not passing)
+    print(f"📊 {len(state)} skills checked: {len(state) - failing} passed, {failing} failed")
+
+    watcher = make_watcher(root, skills, force_poll, interval)
+    print(f"👀 Watching {root} ({type(watcher).__name__}), Ctrl-C to stop")
+
+    try:
+        while True:
+            try:
+                batch = next_batch(watcher, debounce)
+            except WatchLimitError as e:
+                print(f"⚠️  {e}, falling back to polling")
+                watcher.close()
+                watcher = PollingWatcher(root, skills, interval)
+                # Changes may have been missed while switching over
+                batch = set(skills)
+            started = time.perf_counter()
+            results = check_skills(sorted(batch), workers)
+            report_changes(root, results, state)
+            # Removed skills stop being watched
+            skills.intersection_update(state)
+            elapsed = (time.perf_counter() - started) * 1000
+            failing = sum(1 for passing, _ in state.values() if not passing)
+            print(f"🔁 Revalidated {len(batch)} skill(s) in {elapsed:.0f} ms — {failing} failing")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+    return not any(not passing for passing, _ in state.values())
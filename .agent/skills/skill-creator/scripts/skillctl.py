@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Single entry point for the skill tools.
+
+Each subcommand lives in its own script and is imported only when it is
+run, so `skillctl validate` never pays for the packager's imports and
+`--help` stays fast enough for editor hooks.
+
+Usage:
+    python skillctl.py init my-skill --path ./skills
+    python skillctl.py validate ./my-skill
+    python skillctl.py package ./my-skill ./dist
+"""
+
+import sys
+
+# command -> (module, summary); modules are imported on demand
+COMMANDS = {
+    "init": ("init_skill", "Create a new skill from the template"),
+    "validate": ("quick_validate", "Validate a skill or a tree of skills"),
+    "package": ("package_skill", "Package a skill into a .zip file"),
+    "delta": ("skill_delta", "Create or apply a delta between two packages"),
+    "index": ("skill_index", "Build or search the skill catalog index"),
+    "daemon": ("validate_daemon", "Run the background validation daemon"),
+    "bench": ("benchmark", "Benchmark validate and package on a synthetic catalog"),
+}
+
+
+def usage() -> str:
+    """Build the top-level help text without importing argparse."""
+    lines = ["usage: skillctl <command> [options]", "", "commands:"]
+    for name, (_, summary) in COMMANDS.items():
+        lines.append(f"  {name:<10} {summary}")
+    lines.append("")
+    lines.append("Run 'skillctl <command> --help' for command options.")
+    return "\n".join(lines)
+
+
+def main(argv: list = None) -> None:
+    """Dispatch to the subcommand's main()."""
+    argv = sys.argv[1:] if argv is None else argv
+
+    if not argv or argv[0] in ("-h", "--help"):
+        print(usage())
+        sys.exit(0 if argv else 2)
+
+    command, rest = argv[0], argv[1:]
+    if command not in COMMANDS:
+        print(f"❌ Unknown command: {command}\n", file=sys.stderr)
+        print(usage(), file=sys.stderr)
+        sys.exit(2)
+
+    import importlib
+
+    module = importlib.import_module(COMMANDS[command][0])
+    module.main(rest, prog=f"skillctl {command}")
+
+
+if __name__ == "__main__":
+    main()
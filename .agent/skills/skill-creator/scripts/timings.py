@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Per-phase timing and profiling for the skill tools.
+
+Usage:
+    timings = Timings("package", "my-skill")
+    with timings.phase("walk") as phase:
+        entries = collect_entries(skill_path)
+        phase["files"] = len(entries)
+    timings.report("table")
+"""
+
+import json
+import sys
+import time
+from contextlib import contextmanager
+
+COUNTERS = ("files", "bytes_read", "bytes_written")
+
+
+class Timings:
+    """Wall time, CPU time and I/O counters for each phase of one run."""
+
+    def __init__(self, tool: str = "", target: str = ""):
+        self.tool = tool
+        self.target = target
+        self.phases = []
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a block; the yielded dict takes counters (files, bytes_read, ...)."""
+        record = {"phase": name}
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield record
+        finally:
+            record["wall_ms"] = (time.perf_counter() - wall) * 1000
+            record["cpu_ms"] = (time.process_time() - cpu) * 1000
+            self.phases.append(record)
+
+    def add(self, name: str, wall_ms: float, cpu_ms: float = None, **counters) -> None:
+        """Record a phase measured elsewhere (e.g. time spent in disk writes)."""
+        self.phases.append({"phase": name, "wall_ms": wall_ms, "cpu_ms": cpu_ms, **counters})
+
+    def totals(self) -> dict:
+        """Sum every phase into a single record."""
+        total = {"phase": "total", "wall_ms": 0.0, "cpu_ms": 0.0}
+        for record in self.phases:
+            total["wall_ms"] += record["wall_ms"]
+            total["cpu_ms"] += record.get("cpu_ms") or 0.0
+            for key in COUNTERS:
+                if key in record:
+                    # Phases often see the same files, so report the most any one saw
+                    merge = max if key == "files" else sum
+                    total[key] = merge((total.get(key, 0), record[key]))
+        return total
+
+    def json_lines(self) -> list:
+        """One JSON object per phase plus a total, for metrics pipelines."""
+        lines = []
+        for record in [*self.phases, self.totals()]:
+            row = {"tool": self.tool, "target": self.target, **record}
+            for key in ("wall_ms", "cpu_ms"):
+                if row.get(key) is not None:
+                    row[key] = round(row[key], 3)
+            lines.append(json.dumps(row))
+        return lines
+
+    def table(self) -> str:
+        """Human-readable table of every phase."""
+        header = f"{'phase':<18}{'wall ms':>10}{'cpu ms':>10}{'files':>8}{'read':>12}{'written':>12}"
+        rows = [f"⏱️  {self.tool} {self.target}".rstrip(), header, "-" * len(header)]
+        for record in [*self.phases, self.totals()]:
+            cpu = record.get("cpu_ms")
+            rows.append(
+                f"{record['phase']:<18}{record['wall_ms']:>10.2f}"
+                f"{(f'{cpu:.2f}' if cpu is not None else '-'):>10}"
+                f"{record.get('files', ''):>8}"
+                f"{format_bytes(record.get('bytes_read')):>12}"
+                f"{format_bytes(record.get('bytes_written')):>12}"
+            )
+        for record in self.phases:
+            if "compression_ratio" in record:
+                rows.append(f"{record['phase']} ratio: {record['compression_ratio']:.1%} of original size")
+        return "\n".join(rows)
+
+    def report(self, fmt: str = "table", file=None) -> None:
+        """Print the timings as a table or JSON lines (to stderr by default)."""
+        file = file or sys.stderr
+        if fmt == "json":
+            for line in self.json_lines():
+                print(line, file=file)
+        else:
+            print(self.table(), file=file)
+
+
+def format_bytes(n) -> str:
+    """Short human-readable byte count ('' when unknown)."""
+    if n is None:
+        return ""
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+
+
+@contextmanager
+def profiled(path: str = None):
+    """Run the block under cProfile and dump stats to path (no-op if None)."""
+    if not path:
+        yield
+        return
+
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+        print(f"🔬 Profile written to {path} (view with: python -m pstats {path})", file=sys.stderr)
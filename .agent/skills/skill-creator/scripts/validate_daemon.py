@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Long-running validation daemon for editor and pre-commit hooks.
+
+Keeps validation results in memory and serves them over a Unix domain
+socket, so a hook pays for a socket round trip instead of a fresh
+interpreter. Entries are invalidated when SKILL.md or the skill's
+directories change mtime, and the daemon exits after sitting idle.
+
+Protocol: one JSON object per line in each direction.
+    {"op": "validate", "path": "/abs/skill"} -> {"ok": true, "errors": [], "warnings": [], "cached": false}
+    {"op": "ping"}                           -> {"ok": true}
+    {"op": "shutdown"}                       -> {"ok": true}
+
+Usage:
+    python validate_daemon.py &
+    python quick_validate.py ./my-skill --daemon
+    python validate_daemon.py --stop
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+import time
+from pathlib import Path
+
+DEFAULT_IDLE_TIMEOUT = 600.0
+CLIENT_TIMEOUT = 5.0
+
+
+def default_socket_path() -> Path:
+    """Per-user socket location."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "skill-validate.sock"
+    return Path(f"/tmp/skill-validate-{os.getuid()}.sock")
+
+
+def skill_signature(skill_path: Path) -> tuple:
+    """mtimes that change whenever a validation result could change.
+
+    SKILL.md covers the frontmatter; the directory mtimes cover files
+    being added or removed (which drives the empty-directory checks).
+    """
+
+    signature = []
+    for path in (skill_path, skill_path / "SKILL.md", skill_path / "scripts", skill_path / "references"):
+        try:
+            st = os.stat(path)
+            signature.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def send_request(request: dict, socket_path: Path = None, timeout: float = CLIENT_TIMEOUT) -> dict:
+    """Send one request to the daemon, or return None if none is running."""
+
+    socket_path = socket_path or default_socket_path()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(socket_path))
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+    except OSError:
+        return None
+
+    if not line:
+        return None
+    return json.loads(line)
+
+
+def request_validation(skill_path: Path, socket_path: Path = None) -> tuple:
+    """Validate through the daemon, returning (errors, warnings) or None."""
+
+    response = send_request({"op": "validate", "path": str(Path(skill_path).resolve())}, socket_path)
+    if response is None or "errors" not in response:
+        return None
+    return response["errors"], response["warnings"]
+
+
+class ValidationDaemon:
+    """asyncio server holding validation results keyed by skill path."""
+
+    def __init__(self, socket_path: Path, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout
+        self.results = {}
+        self.active = 0
+        # Open connections (task -> writer), closed on shutdown
+        self.clients = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def validate(self, skill_path: Path) -> dict:
+        """Return the cached result, revalidating if the skill changed."""
+        import asyncio
+
+        from quick_validate import check_skill
+
+        key = str(skill_path)
+        signature = skill_signature(skill_path)
+        cached = self.results.get(key)
+        if cached and cached[0] == signature:
+            self.hits += 1
+            errors, warnings = cached[1]
+            return {"ok": not errors, "errors": errors, "warnings": warnings, "cached": True}
+
+        self.misses += 1
+        errors, warnings = await asyncio.to_thread(check_skill, skill_path)
+        self.results[key] = (signature, (errors, warnings))
+        return {"ok": not errors, "errors": errors, "warnings": warnings, "cached": False}
+
+    async def handle(self, request: dict) -> dict:
+        """Answer a single request."""
+        op = request.get("op")
+        if op == "validate" and request.get("path"):
+            return await self.validate(Path(request["path"]))
+        if op == "ping":
+            return {"ok": True, "entries": len(self.results), "hits": self.hits, "misses": self.misses}
+        if op == "shutdown":
+            self.stopping.set()
+            return {"ok": True}
+        return {"ok": False, "error": f"Unknown request: {request}"}
+
+    async def serve_client(self, reader, writer) -> None:
+        """Serve requests from one client until it disconnects."""
+        import asyncio
+
+        task = asyncio.current_task()
+        self.clients[task] = writer
+        self.active += 1
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                self.touch()
+                try:
+                    response = await self.handle(json.loads(line))
+                except (ValueError, AttributeError) as e:
+                    response = {"ok": False, "error": f"Bad request: {e}"}
+                except Exception as e:
+                    response = {"ok": False, "error": f"Validation error: {e}"}
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+                if self.stopping.is_set():
+                    break
+        except (ConnectionError, asyncio.CancelledError):
+            # Cancelled by close_clients() when the daemon shuts down
+            pass
+        finally:
+            self.clients.pop(task, None)
+            self.active -= 1
+            self.touch()
+            writer.close()
+
+    async def close_clients(self) -> None:
+        """Disconnect every client still connected (e.g. an idle editor)."""
+        import asyncio
+
+        tasks = list(self.clients)
+        for task, writer in list(self.clients.items()):
+            writer.close()
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def touch(self) -> None:
+        """Record activity for the idle timer."""
+        self.last_activity = time.monotonic()
+
+    async def watch_idle(self) -> None:
+        """Stop the server once it has been idle for idle_timeout seconds."""
+        import asyncio
+
+        while not self.stopping.is_set():
+            idle = time.monotonic() - self.last_activity
+            if self.active == 0 and idle >= self.idle_timeout:
+                print(f"💤 Idle for {self.idle_timeout:.0f}s, shutting down")
+                self.stopping.set()
+                return
+            await asyncio.sleep(min(self.idle_timeout, 1.0))
+
+    async def run(self) -> None:
+        """Serve until shut down or idle."""
+        import asyncio
+
+        self.stopping = asyncio.Event()
+        self.touch()
+        server = await asyncio.start_unix_server(self.serve_client, path=str(self.socket_path))
+        os.chmod(self.socket_path, 0o600)
+        print(f"🟢 Validation daemon listening on {self.socket_path}")
+
+        idle_task = asyncio.create_task(self.watch_idle())
+        try:
+            await self.stopping.wait()
+        finally:
+            idle_task.cancel()
+            server.close()
+            # wait_closed() waits for open connections on Python 3.12+
+            await self.close_clients()
+            await server.wait_closed()
+            self.socket_path.unlink(missing_ok=True)
+            print(f"📊 Served {self.hits} cached and {self.misses} fresh validation(s)")
+
+
+def start_daemon(socket_path: Path, idle_timeout: float) -> bool:
+    """Run the daemon in the foreground."""
+    import asyncio
+
+    if send_request({"op": "ping"}, socket_path) is not None:
+        print(f"❌ A daemon is already running on {socket_path}")
+        return False
+
+    # Nobody answered: whatever is left at the path is a stale socket
+    socket_path.unlink(missing_ok=True)
+
+    try:
+        asyncio.run(ValidationDaemon(socket_path, idle_timeout).run())
+    except KeyboardInterrupt:
+        socket_path.unlink(missing_ok=True)
+    return True
+
+
+def main(argv: list = None, prog: str = None):
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description="Run a validation daemon on a Unix domain socket"
+    )
+
+    parser.add_argument(
+        "--socket",
+        default=None,
+        help=f"Socket path (default: {default_socket_path()})"
+    )
+
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT,
+        help=f"Exit after this many idle seconds (default: {DEFAULT_IDLE_TIMEOUT:.0f})"
+    )
+
+    parser.add_argument(
+        "--stop",
+        action="store_true",
+        help="Ask a running daemon to shut down"
+    )
+
+    parser.add_argument(
+        "--status",
+        action="store_true",
+        help="Report whether a daemon is running"
+    )
+
+    args = parser.parse_args(argv)
+    socket_path = Path(args.socket) if args.socket else default_socket_path()
+
+    if args.stop or args.status:
+        response = send_request({"op": "shutdown" if args.stop else "ping"}, socket_path)
+        if response is None:
+            print(f"⚪ No daemon running on {socket_path}")
+            sys.exit(1)
+        if args.stop:
+            print("🛑 Daemon stopped")
+        else:
+            print(f"🟢 Daemon running: {response['entries']} cached skill(s), "
+                  f"{response['hits']} hit(s), {response['misses']} miss(es)")
+        sys.exit(0)
+
+    if start_daemon(socket_path, args.idle_timeout):
+        sys.exit(0)
+    else:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()